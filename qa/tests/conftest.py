@@ -3,6 +3,8 @@ Pytest fixtures for QA tests.
 Mocks Binance API and file I/O so tests do not hit live services.
 Demo tests (marker: demo) hit Binance demo API when credentials are set.
 """
+import json
+import logging
 import os
 import sys
 from pathlib import Path
@@ -34,6 +36,28 @@ def require_demo_credentials():
     yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_trade_log(tmp_path, monkeypatch):
+    """Point the trade log at tmp_path so tests never create data/binance/orders/binance_trade_api.log.
+
+    Autouse because any signed request, rate-limit wait or close failure logs through it; yields the log path.
+    """
+    import binance_trade_api as bta
+
+    log = logging.getLogger("binance_trade_api")
+    saved = log.handlers[:]
+    for h in saved:
+        log.removeHandler(h)
+    path = tmp_path / "binance_trade_api.log"
+    monkeypatch.setattr(bta, "TRADE_LOG_PATH", path)
+    yield path
+    for h in log.handlers[:]:
+        log.removeHandler(h)
+        h.close()
+    for h in saved:
+        log.addHandler(h)
+
+
 @pytest.fixture
 def mock_get_keys():
     """Provide fake API key/secret so _get_keys() does not read env or exit."""
@@ -52,12 +76,22 @@ def mock_signed_request():
 
 @pytest.fixture
 def mock_get_mark_price():
-    """Mock _get_mark_price to return a fixed price."""
-    with patch("binance_trade_api._get_mark_price") as m:
+    """Mock _get_mark_price to return a fixed price (bulk prefetch disabled so every lookup hits the mock)."""
+    with patch("binance_trade_api._get_mark_price") as m, patch(
+        "binance_trade_api._fetch_all_mark_prices", return_value={}
+    ):
         m.return_value = 50000.0
         yield m
 
 
+@pytest.fixture(autouse=True)
+def clear_mark_price_cache():
+    """Start every test with an empty mark price cache so mocked prices are always fetched."""
+    import binance_trade_api as bta
+    bta._mark_cache.clear()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def mock_append_order_status_audit():
     """Avoid writing to order_status_audit.csv during tests."""
@@ -78,28 +112,28 @@ def _mock_exchange_info_json():
 
 @pytest.fixture
 def mock_exchange_info():
-    """Mock requests.get so exchangeInfo returns valid symbols (BTCUSDT, ETHUSDT, 1000HYPEUSDT). Use for tests that trigger resolve_symbol."""
+    """Mock _SESSION.get so exchangeInfo returns valid symbols (BTCUSDT, ETHUSDT, 1000HYPEUSDT). Use for tests that trigger resolve_symbol."""
     def _get(url, timeout=None, **kwargs):
         resp = MagicMock()
         resp.raise_for_status = MagicMock()
         if "exchangeInfo" in (url or ""):
-            resp.json.return_value = _mock_exchange_info_json()
+            resp.content = json.dumps(_mock_exchange_info_json()).encode()
         else:
-            resp.json.return_value = {"price": "50000.5"}
+            resp.content = b'{"price": "50000.5"}'
         return resp
 
-    with patch("binance_trade_api.requests.get", side_effect=_get) as m:
+    with patch("binance_trade_api._SESSION.get", side_effect=_get) as m:
         yield m
 
 
 @pytest.fixture
 def mock_requests_get():
-    """Mock requests.get for _get_mark_price when testing that function directly."""
-    # Patch where used (binance_trade_api imports requests)
-    with patch("binance_trade_api.requests.get") as m:
+    """Mock _SESSION.get for _get_mark_price when testing that function directly."""
+    # Patch where used (binance_trade_api routes HTTP through its module-level session)
+    with patch("binance_trade_api._SESSION.get") as m:
         resp = MagicMock()
         resp.status_code = 200
-        resp.json.return_value = {"price": "50000.5"}
+        resp.content = b'{"price": "50000.5"}'
         resp.raise_for_status = MagicMock()
         m.return_value = resp
         yield m
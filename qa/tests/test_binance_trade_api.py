@@ -32,6 +32,12 @@ def test_direct_to_side_short():
     assert bta._direct_to_side("  SHORT  ") == "SELL"
 
 
+@pytest.mark.unit
+def test_direct_to_side_buy_sell():
+    assert bta._direct_to_side("BUY") == "BUY"
+    assert bta._direct_to_side(" sell ") == "SELL"
+
+
 @pytest.mark.unit
 def test_direct_to_side_invalid_raises():
     with pytest.raises(ValueError, match="Unknown direct"):
@@ -75,6 +81,51 @@ def test_quantity_from_usdt_non_positive_quantity():
         bta._quantity_from_usdt("BTCUSDT", 0.0001, 50000.0, quantity_precision=6)  # qty too small
 
 
+@pytest.mark.unit
+def test_quantity_from_usdt_no_float_drift():
+    # float: floor(0.3 / 0.1 * 1000) / 1000 == 2.999
+    assert bta._quantity_from_usdt("BTCUSDT", 0.3, 0.1, quantity_precision=3) == "3.000"
+    assert bta._quantity_from_usdt("BTCUSDT", 1000.0, 3.0, quantity_precision=0) == "333"
+
+
+@pytest.mark.unit
+def test_quantity_precision_is_clamped():
+    assert bta._quantity_from_usdt("BTCUSDT", 1000.0, 3.0, quantity_precision=-2) == "333"
+    assert bta._quantity_from_usdt("BTCUSDT", 1.0, 3.0, quantity_precision=12) == "0.33333333"
+
+
+# ---------- TC-03: symbol lookup table (unit) ----------
+@pytest.mark.unit
+def test_build_symbol_lookup_aliases():
+    lookup = bta._build_symbol_lookup(
+        ["BTCUSDT", "1000HYPEUSDT"],
+        {"BTC": "BTCUSDT", "1000HYPE": "1000HYPEUSDT", "HYPE": "1000HYPEUSDT"},
+    )
+    assert lookup["BTCUSDT"] == "BTCUSDT"
+    assert lookup["BTC"] == "BTCUSDT"
+    assert lookup["HYPE"] == "1000HYPEUSDT"
+    assert lookup["HYPEUSDT"] == "1000HYPEUSDT"
+    assert lookup["1000HYPE"] == "1000HYPEUSDT"
+    assert lookup["1000HYPEUSDT"] == "1000HYPEUSDT"
+    assert "ETH" not in lookup
+
+
+@pytest.mark.unit
+def test_usdt_symbol_normalizes_input():
+    assert bta._usdt_symbol("BTC") == "BTCUSDT"
+    assert bta._usdt_symbol("BTCUSDT") == "BTCUSDT"
+    assert bta._usdt_symbol("  eth ") == "ETHUSDT"
+    assert bta._usdt_symbol("1000hypeusdt") == "1000HYPEUSDT"
+    assert bta._usdt_symbol(None) == "USDT"
+
+
+@pytest.mark.unit
+def test_resolve_symbol_unknown_raises(mock_exchange_info):
+    with pytest.raises(ValueError, match="Unknown or unsupported symbol"):
+        bta.resolve_symbol("NOPEUSDT")
+    assert bta.resolve_symbol("hype") == "1000HYPEUSDT"
+
+
 # ---------- TC-04: set_leverage (integration, mocked) ----------
 @pytest.mark.integration
 def test_set_leverage_calls_signed_request(mock_get_keys, mock_signed_request):
@@ -163,6 +214,31 @@ def test_close_position_success_reduce_only(mock_get_keys, mock_signed_request):
     assert order_params["type"] == "MARKET"
 
 
+@pytest.mark.integration
+def test_close_position_uses_positions_snapshot(mock_get_keys, mock_signed_request):
+    mock_signed_request.return_value = (200, {"orderId": 3})
+    positions = {"BTCUSDT": {"symbol": "BTCUSDT", "positionAmt": "-0.2"}}
+    result = bta.close_position("BTCUSDT", fraction=0.5, api_key="k", api_secret="s", positions=positions)
+    assert result["orderId"] == 3
+    mock_signed_request.assert_called_once()
+    order_params = mock_signed_request.call_args[0][4]
+    assert order_params["side"] == "BUY"
+    assert float(order_params["quantity"]) == 0.1
+
+
+@pytest.mark.unit
+def test_close_position_reports_through_emit(mock_get_keys, mock_signed_request):
+    mock_signed_request.return_value = (200, {"orderId": 3})
+    positions = {"BTCUSDT": {"symbol": "BTCUSDT", "positionAmt": "0.2"}}
+    with patch.object(bta, "_emit") as emit:
+        bta.close_position("ETHUSDT", api_key="k", api_secret="s", positions=positions)
+        bta.close_position("BTCUSDT", api_key="k", api_secret="s", positions=positions)
+    assert [c[0][0].split(":")[0] for c in emit.call_args_list] == [
+        "No open position for ETHUSDT; nothing to close.",
+        "Closing position for BTCUSDT",
+    ]
+
+
 # ---------- TC-07: close_position_limit (integration) ----------
 @pytest.mark.integration
 def test_close_position_limit_success(mock_get_keys, mock_signed_request):
@@ -174,6 +250,7 @@ def test_close_position_limit_success(mock_get_keys, mock_signed_request):
         "BTCUSDT", fraction=1.0, price=49000.0, api_key="k", api_secret="s"
     )
     assert result["orderId"] == 2
+    assert mock_signed_request.call_args_list[0][0][4] == {"symbol": "BTCUSDT"}
     order_params = mock_signed_request.call_args_list[1][0][4]
     assert order_params["type"] == "LIMIT"
     assert order_params["timeInForce"] == "GTC"
@@ -219,6 +296,78 @@ def test_place_batch_orders_chunks_of_five(mock_get_keys, mock_get_mark_price, m
     assert mock_signed_request.call_count == 2
 
 
+@pytest.mark.integration
+def test_place_batch_orders_concurrent_chunks_keep_order(mock_get_keys, mock_get_mark_price, mock_signed_request, mock_exchange_info):
+    import json
+
+    def _respond(api_key, api_secret, method, path, params, order_count=None):
+        batch = json.loads(params["batchOrders"])
+        assert order_count == len(batch)
+        return 200, [{"orderId": o["side"] + str(len(batch))} for o in batch]
+
+    mock_signed_request.side_effect = _respond
+    orders = [{"symbol": "BTCUSDT", "amountUsdt": 100, "positionSide": "LONG"}] * 5 + [
+        {"symbol": "ETHUSDT", "amountUsdt": 100, "positionSide": "SHORT"}
+    ]
+    result = bta.place_batch_orders(orders, api_key="k", api_secret="s")
+    assert [r["orderId"] for r in result] == ["BUY5"] * 5 + ["SELL1"]
+
+
+@pytest.mark.integration
+def test_place_batch_orders_failed_chunk_keeps_other_chunks(mock_get_keys, mock_get_mark_price, mock_signed_request, mock_exchange_info, isolated_trade_log):
+    import json
+
+    def _respond(api_key, api_secret, method, path, params, order_count=None):
+        batch = json.loads(params["batchOrders"])
+        if len(batch) == 5:
+            raise RuntimeError("Binance error 400: {'code': -1102}")
+        return 200, [{"orderId": 99}]
+
+    mock_signed_request.side_effect = _respond
+    orders = [{"symbol": "BTCUSDT", "amountUsdt": 100, "positionSide": "LONG"}] * 6
+    with patch.object(bta, "append_order_status_audit") as audit:
+        result = bta.place_batch_orders(orders, api_key="k", api_secret="s")
+    assert result[:5] == [{"error": "Binance error 400: {'code': -1102}"}] * 5
+    assert result[5] == {"orderId": 99}
+    audit.assert_called_once_with({"orderId": 99}, event_type="placed", source="batch")
+    assert "batchOrders chunk of 5 failed" in isolated_trade_log.read_text(encoding="utf-8")
+
+
+@pytest.mark.integration
+def test_place_batch_orders_all_chunks_failed_raises(mock_get_keys, mock_get_mark_price, mock_signed_request, mock_exchange_info):
+    mock_signed_request.side_effect = RuntimeError("Binance error 401")
+    orders = [{"symbol": "BTCUSDT", "amountUsdt": 100, "positionSide": "LONG"}] * 6
+    with patch.object(bta, "append_order_status_audit") as audit:
+        with pytest.raises(RuntimeError, match="Binance error 401"):
+            bta.place_batch_orders(orders, api_key="k", api_secret="s")
+    audit.assert_not_called()
+
+
+@pytest.mark.integration
+def test_place_batch_orders_sets_leverage_once_per_symbol(mock_get_keys, mock_get_mark_price, mock_signed_request, mock_exchange_info):
+    mock_signed_request.return_value = (200, [{"orderId": 1}])
+    orders = [
+        {"symbol": "BTC", "amountUsdt": 100, "positionSide": "LONG"},
+        {"symbol": "BTCUSDT", "amountUsdt": 100, "positionSide": "SHORT"},
+        {"symbol": "ETHUSDT", "amountUsdt": 100, "positionSide": "LONG"},
+    ]
+    with patch.object(bta, "set_leverage", MagicMock()) as m:
+        bta.place_batch_orders(orders, api_key="k", api_secret="s", leverage=5)
+    assert sorted(c[0][0] for c in m.call_args_list) == ["BTCUSDT", "ETHUSDT"]
+
+
+@pytest.mark.integration
+def test_place_batch_orders_leverage_failure_blocks_orders(mock_get_keys, mock_get_mark_price, mock_signed_request, mock_exchange_info):
+    orders = [
+        {"symbol": "BTCUSDT", "amountUsdt": 100, "positionSide": "LONG"},
+        {"symbol": "ETHUSDT", "amountUsdt": 100, "positionSide": "LONG"},
+    ]
+    with patch.object(bta, "set_leverage", MagicMock(side_effect=RuntimeError("Binance error 400"))):
+        with pytest.raises(RuntimeError, match="Binance error 400"):
+            bta.place_batch_orders(orders, api_key="k", api_secret="s", leverage=5)
+    mock_signed_request.assert_not_called()
+
+
 @pytest.mark.integration
 def test_place_batch_orders_position_side_maps_to_side(mock_get_keys, mock_get_mark_price, mock_signed_request):
     mock_signed_request.return_value = (200, [{"orderId": 1}])
@@ -233,6 +382,51 @@ def test_place_batch_orders_position_side_maps_to_side(mock_get_keys, mock_get_m
     assert batch[0]["side"] == "SELL"
 
 
+@pytest.mark.integration
+def test_place_batch_orders_prefetches_marks_once(mock_get_keys, mock_signed_request, mock_exchange_info):
+    mock_signed_request.return_value = (200, [{"orderId": 1}])
+    orders = [
+        {"symbol": "BTCUSDT", "amountUsdt": 100, "positionSide": "LONG"},
+        {"symbol": "ETHUSDT", "amountUsdt": 100, "positionSide": "SHORT"},
+        {"symbol": "BTCUSDT", "type": "LIMIT", "price": 49000, "amountUsdt": 100, "positionSide": "LONG"},
+    ]
+    bulk = MagicMock(return_value={"BTCUSDT": 50000.0, "ETHUSDT": 2500.0})
+    with patch.object(bta, "_fetch_all_mark_prices", bulk), patch.object(
+        bta, "_get_mark_price", MagicMock(side_effect=AssertionError("per-symbol fetch"))
+    ):
+        bta.place_batch_orders(orders, api_key="k", api_secret="s")
+    bulk.assert_called_once()
+
+
+@pytest.mark.unit
+def test_prepare_batch_normalizes_columns(mock_exchange_info):
+    prepared = bta._prepare_batch([
+        {"symbol": "btc", "amountUsdt": "100", "positionSide": "short"},
+        {"symbol": "ETHUSDT", "type": "limit", "amount_usdt": 50, "price": "3000"},
+        {"symbol": "ETHUSDT", "type": "LIMIT", "amountUsdt": 50, "price": ""},
+    ])
+    assert prepared.symbols == ["BTCUSDT", "ETHUSDT", "ETHUSDT"]
+    assert prepared.sides == ["SELL", "BUY", "BUY"]
+    assert prepared.types == ["MARKET", "LIMIT", "LIMIT"]
+    assert prepared.amounts_usdt == [100.0, 50.0, 50.0]
+    assert prepared.prices == [None, 3000.0, None]
+
+
+@pytest.mark.unit
+def test_serialize_batch_matches_compact_json():
+    import json
+    payloads = [
+        {"symbol": "BTCUSDT", "side": "BUY", "type": "MARKET", "quantity": "0.002"},
+        {"symbol": "ETHUSDT", "side": "SELL", "type": "LIMIT", "quantity": "0.100", "timeInForce": "GTC", "price": "3000.5"},
+    ]
+    entries = [
+        bta._serialize_order("BTCUSDT", "BUY", "MARKET", "0.002", "50000.0"),
+        bta._serialize_order("ETHUSDT", "SELL", "LIMIT", "0.100", "3000.5"),
+    ]
+    assert bta._serialize_batch(entries) == json.dumps(payloads, separators=(",", ":"))
+    assert bta._serialize_batch([]) == "[]"
+
+
 # ---------- TC-09: place_orders_from_csv (integration) ----------
 @pytest.mark.integration
 def test_place_orders_from_csv_file_not_found():
@@ -278,6 +472,97 @@ def test_place_orders_from_csv_close_calls_close_position(mock_get_keys, mock_si
     assert mock_signed_request.call_count >= 2
 
 
+@pytest.mark.integration
+def test_place_orders_from_rows_parallel_keeps_row_order(mock_get_keys, mock_exchange_info):
+    calls = []
+
+    def _order(symbol, side, size_usdt, **kwargs):
+        calls.append((symbol, side))
+        return {"symbol": symbol, "side": side}
+
+    rows = [
+        {"currency": "BTC", "size_usdt": "100", "direct": "Long"},
+        {"currency": "ETH", "size_usdt": "100", "direct": "Short"},
+        {"currency": "BTC", "size_usdt": "50", "direct": "Short"},
+    ]
+    with patch.object(bta, "place_market_order", side_effect=_order), patch.object(
+        bta, "_fetch_all_mark_prices", return_value={}
+    ):
+        out = bta.place_orders_from_rows(rows, api_key="k", api_secret="s", parallel=4)
+    assert out["success"]
+    assert [r["response"]["symbol"] for r in out["results"]] == ["BTCUSDT", "ETHUSDT", "BTCUSDT"]
+    assert [side for sym, side in calls if sym == "BTCUSDT"] == ["BUY", "SELL"]
+
+
+@pytest.mark.unit
+def test_row_symbol_key_chains_on_resolved_contract(mock_exchange_info, monkeypatch):
+    monkeypatch.setattr(bta, "_symbol_lookup", {})
+    keys = [bta._row_symbol_key({"currency": c}) for c in ("BTC", " btcusdt", "HYPE", "1000HYPE")]
+    assert keys == ["BTCUSDT", "BTCUSDT", "1000HYPEUSDT", "1000HYPEUSDT"]
+    assert bta._row_symbol_key({"currency": "NOPE"}) == "NOPE"
+    assert bta._row_symbol_key({}) == ""
+
+@pytest.mark.unit
+def test_place_rows_parallel_bounds_rows_in_flight():
+    pulled = []
+
+    def _rows():
+        for i in range(100):
+            pulled.append(i)
+            yield {"currency": f"C{i}", "size_usdt": "10", "direct": "Long"}
+
+    outcome = bta._RowOutcome([], [], None)
+    with patch.object(bta, "_place_row", MagicMock(return_value=outcome)) as place:
+        outcomes = bta._place_rows_parallel(_rows(), "k", "s", 2, None)
+        assert next(outcomes) is outcome
+        outcomes.close()
+    # window of 2 * parallel rows submitted, plus the one that triggered the first yield
+    assert len(pulled) == 5
+    assert place.call_count <= 4
+
+
+@pytest.mark.integration
+def test_place_orders_from_rows_sizes_from_one_price_snapshot(mock_get_keys, mock_exchange_info):
+    rows = [
+        {"currency": "BTC", "size_usdt": "100", "direct": "Long"},
+        {"currency": "ETH", "size_usdt": "100", "direct": "Short"},
+        {"currency": "BTC", "size_usdt": "50", "direct": "Short"},
+    ]
+    bulk = MagicMock(return_value={"BTCUSDT": 50000.0, "ETHUSDT": 2500.0})
+    with patch.object(bta, "_fetch_all_mark_prices", bulk), patch.object(
+        bta, "place_market_order", MagicMock(return_value={"orderId": 1})
+    ) as m:
+        bta.place_orders_from_rows(rows, api_key="k", api_secret="s")
+    bulk.assert_called_once()
+    # The first row only knows one symbol, so it is sized from its own ticker request.
+    assert [c[1]["price_hint"] for c in m.call_args_list] == [None, 2500.0, 50000.0]
+
+
+@pytest.mark.integration
+def test_place_orders_from_rows_single_symbol_skips_bulk_prices(mock_get_keys, mock_exchange_info):
+    rows = [
+        {"currency": "BTC", "size_usdt": "100", "direct": "Long"},
+        {"currency": "BTC", "size_usdt": "50", "direct": "Short"},
+    ]
+    bulk = MagicMock(return_value={"BTCUSDT": 50000.0})
+    with patch.object(bta, "_fetch_all_mark_prices", bulk), patch.object(
+        bta, "place_market_order", MagicMock(return_value={"orderId": 1})
+    ) as m:
+        bta.place_orders_from_rows(rows, api_key="k", api_secret="s")
+    bulk.assert_not_called()
+    assert [c[1]["price_hint"] for c in m.call_args_list] == [None, None]
+
+
+@pytest.mark.unit
+def test_mark_snapshot_expires():
+    snap = bta._MarkSnapshot(max_age=-1.0)
+    with patch.object(bta, "_fetch_all_mark_prices", return_value={"BTCUSDT": 1.0, "ETHUSDT": 2.0}) as bulk:
+        assert snap.get("BTCUSDT") is None
+        assert snap.get("ETHUSDT") is None
+        assert snap.get("BTCUSDT") is None
+    bulk.assert_called_once()
+
+
 # ---------- TC-10: place_close_orders_from_template (integration) ----------
 @pytest.mark.integration
 def test_place_close_orders_from_template_file_not_found():
@@ -296,6 +581,120 @@ def test_place_close_orders_from_template_market(mock_get_keys, mock_signed_requ
     assert mock_signed_request.call_count >= 2
 
 
+@pytest.mark.integration
+def test_place_close_orders_from_template_keeps_per_symbol_order(mock_get_keys, mock_exchange_info, tmp_path):
+    path = tmp_path / "order_close_template.csv"
+    path.write_text(
+        "symbol,fraction,order_type,price\n"
+        "BTCUSDT,0.5,MARKET,\n"
+        "ETHUSDT,1.0,MARKET,\n"
+        "BTC,1.0,MARKET,\n",
+        encoding="utf-8",
+    )
+    snapshot = {"BTCUSDT": {"symbol": "BTCUSDT", "positionAmt": "0.2"}}
+    with patch.object(bta, "_fetch_positions", MagicMock(return_value=snapshot)) as fetch, patch.object(
+        bta, "close_position", MagicMock(return_value=None)
+    ) as m:
+        bta.place_close_orders_from_template(path)
+    fetch.assert_called_once()
+    calls = [(c[0][0], c[1]["fraction"], c[1]["positions"]) for c in m.call_args_list]
+    assert sorted(calls, key=lambda c: c[:2]) == [
+        ("BTCUSDT", 0.5, snapshot),
+        ("BTCUSDT", 1.0, None),  # the first close changed the position; re-fetch
+        ("ETHUSDT", 1.0, snapshot),
+    ]
+    assert [f for sym, f, _ in calls if sym == "BTCUSDT"] == [0.5, 1.0]
+
+
+@pytest.mark.integration
+def test_place_close_orders_from_template_prefetches_marks(mock_get_keys, mock_exchange_info, tmp_path):
+    path = tmp_path / "order_close_template.csv"
+    path.write_text(
+        "symbol,fraction,order_type,price\n"
+        "BTCUSDT,1.0,LIMIT,mark\n"
+        "ETHUSDT,1.0,LIMIT,\n",
+        encoding="utf-8",
+    )
+    prices = {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0}
+    bulk = MagicMock(return_value=prices)
+    # Whichever row asks first is priced on its own; the second symbol triggers the one bulk request.
+    single = MagicMock(side_effect=prices.__getitem__)
+    with patch.object(bta, "_fetch_all_mark_prices", bulk), patch.object(
+        bta, "_get_mark_price", single
+    ), patch.object(bta, "_fetch_positions", MagicMock(return_value={})), patch.object(
+        bta, "close_position_limit", MagicMock(return_value=None)
+    ) as m:
+        bta.place_close_orders_from_template(path)
+    bulk.assert_called_once()
+    assert single.call_count == 1
+    assert sorted((c[0][0], c[1]["price"]) for c in m.call_args_list) == [("BTCUSDT", 50000.0), ("ETHUSDT", 3000.0)]
+
+
+@pytest.mark.unit
+def test_close_template_row_stale_marks_refetch():
+    snap = bta._MarkSnapshot(max_age=-1.0)
+    with patch.object(bta, "_fetch_all_mark_prices", return_value={"BTCUSDT": 1.0, "ETHUSDT": 2.0}):
+        snap.get("ETHUSDT")
+        snap.get("BTCUSDT")  # snapshot taken, but already older than max_age
+    with patch.object(bta, "_get_mark_price", return_value=50000.0) as single, patch.object(
+        bta, "close_position_limit", MagicMock(return_value=None)
+    ) as m:
+        bta._close_template_row("BTCUSDT", 1.0, "LIMIT", "mark", "k", "s", marks=snap)
+    single.assert_called_once_with("BTCUSDT")
+    assert m.call_args[1]["price"] == 50000.0
+
+
+@pytest.mark.unit
+def test_iter_close_template_rows_falls_back_without_pandas(tmp_path, monkeypatch):
+    path = tmp_path / "order_close_template.csv"
+    path.write_text("symbol,fraction,order_type,price\nBTCUSDT,0.5,LIMIT,mark\n", encoding="utf-8")
+    monkeypatch.setattr(bta, "CLOSE_TEMPLATE_PANDAS_MIN_BYTES", 0)
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    rows = list(bta._iter_close_template_rows(path))
+    assert rows == [("BTCUSDT", "0.5", "LIMIT", "mark")]
+
+
+@pytest.mark.unit
+def test_iter_close_template_rows_by_header_index(tmp_path):
+    path = tmp_path / "order_close_template.csv"
+    path.write_text(
+        "price,orderType,symbol,fraction\n"
+        "mark,LIMIT,BTCUSDT,0.5\n"
+        "\n"
+        ",,ETH\n",
+        encoding="utf-8",
+    )
+    rows = list(bta._iter_close_template_rows(path))
+    assert rows == [("BTCUSDT", "0.5", "LIMIT", "mark"), ("ETH", "", "", "")]
+
+
+@pytest.mark.unit
+def test_close_template_row_failure_is_logged_not_raised():
+    err = RuntimeError("boom")
+    log = MagicMock()
+    with patch.object(bta, "close_position", MagicMock(side_effect=err)), patch.object(
+        bta, "_get_stderr_logger", return_value=log
+    ):
+        bta._close_template_row("BTCUSDT", 1.0, "MARKET", "", "k", "s")
+    log.error.assert_called_once_with("Close FAILED for %s: %s", "BTCUSDT", err)
+
+
+@pytest.mark.unit
+def test_emit_writes_lines_in_one_call():
+    with patch.object(bta.sys, "stdout") as out:
+        bta._emit("Using mark price for BTCUSDT: 1.0", "Order OK")
+    out.write.assert_called_once_with("Using mark price for BTCUSDT: 1.0\nOrder OK\n")
+
+
+@pytest.mark.unit
+def test_utc_timestamp_reformats_once_per_second():
+    with patch.object(bta.time, "time", return_value=1_700_000_000.25):
+        first = bta._utc_timestamp()
+        with patch.object(bta.time, "strftime", side_effect=AssertionError("reformatted")):
+            assert bta._utc_timestamp() == first
+    assert first == "2023-11-14 22:13:20"
+
+
 # ---------- TC-11: main() CLI (smoke) ----------
 @pytest.mark.smoke
 def test_main_no_args_exits():
@@ -306,7 +705,7 @@ def test_main_no_args_exits():
 
 
 @pytest.mark.smoke
-def test_main_close_template_calls_place_close(mock_get_keys):
+def test_main_close_template_calls_place_close(mock_get_keys, mock_exchange_info):
     with patch.object(bta, "place_close_orders_from_template", MagicMock()) as m:
         with patch.object(sys, "argv", ["binance_trade_api.py", "--close-template", "/some/path.csv"]):
             bta.main(sys.argv)
@@ -315,7 +714,7 @@ def test_main_close_template_calls_place_close(mock_get_keys):
 
 
 @pytest.mark.smoke
-def test_main_orders_csv_calls_place_orders(mock_get_keys, temp_orders_csv):
+def test_main_orders_csv_calls_place_orders(mock_get_keys, mock_exchange_info, temp_orders_csv):
     with patch.object(bta, "place_orders_from_csv", MagicMock()) as m:
         with patch.object(sys, "argv", ["binance_trade_api.py", str(temp_orders_csv)]):
             bta.main(sys.argv)
@@ -323,6 +722,38 @@ def test_main_orders_csv_calls_place_orders(mock_get_keys, temp_orders_csv):
         assert m.call_args[0][0] == temp_orders_csv
 
 
+@pytest.mark.smoke
+def test_main_primes_symbol_lookup_once(mock_get_keys, mock_exchange_info, monkeypatch):
+    monkeypatch.setattr(bta, "_symbol_lookup", {})
+    with patch.object(bta, "place_close_orders_from_template", MagicMock()):
+        bta.main(["binance_trade_api.py", "--close-template"])
+    assert bta._symbol_lookup["HYPE"] == "1000HYPEUSDT"
+    bta._load_exchange_symbols()
+    assert mock_exchange_info.call_count == 1
+
+
+@pytest.mark.smoke
+def test_main_orders_csv_parallel_flag(mock_get_keys, mock_exchange_info, temp_orders_csv):
+    with patch.object(bta, "place_orders_from_csv", MagicMock()) as m:
+        bta.main(["binance_trade_api.py", str(temp_orders_csv), "--parallel", "4"])
+    assert m.call_args[1]["parallel"] == 4
+    with pytest.raises(SystemExit):
+        bta.main(["binance_trade_api.py", str(temp_orders_csv), "--parallel", "x"])
+    with pytest.raises(SystemExit):
+        bta.main(["binance_trade_api.py", str(temp_orders_csv), "--parallel", "\u00b2"])
+
+
+@pytest.mark.smoke
+@pytest.mark.parametrize("order_id", ["12a", "--5", "\u00b2", "abc"])
+def test_main_order_status_rejects_non_integer_id(mock_get_keys, mock_exchange_info, order_id, capsys):
+    with patch.object(bta, "get_order", MagicMock()) as m:
+        with pytest.raises(SystemExit) as exc_info:
+            bta.main(["binance_trade_api.py", "--order-status", "BTC", order_id])
+    assert exc_info.value.code == 1
+    m.assert_not_called()
+    assert "ORDER_ID must be an integer." in capsys.readouterr().err
+
+
 # ---------- get_order (order status by orderId) ----------
 @pytest.mark.unit
 def test_get_order_requires_order_id_or_client_order_id(mock_get_keys):
@@ -372,12 +803,202 @@ def test_get_mark_price_success(mock_requests_get):
     assert price == 50000.5
 
 
+@pytest.mark.unit
+def test_get_mark_price_cached_within_ttl(mock_requests_get):
+    assert bta._get_mark_price("BTCUSDT") == 50000.5
+    assert bta._get_mark_price("BTCUSDT") == 50000.5
+    assert mock_requests_get.call_count == 1
+
+
+@pytest.mark.unit
+def test_fetch_all_mark_prices_feeds_rate_limiter():
+    ok = MagicMock(status_code=200, headers={"X-MBX-USED-WEIGHT-1M": "42"}, content=b'[{"symbol":"BTCUSDT","price":"1.5"}]')
+    limiter = bta._RateLimiter()
+    with patch.object(bta, "_RATE_LIMITER", limiter), patch("binance_trade_api._SESSION.get", return_value=ok):
+        assert bta._fetch_all_mark_prices() == {"BTCUSDT": 1.5}
+    assert limiter.used_weight_1m[1] == 42
+
+
+@pytest.mark.unit
+def test_signed_request_signature_matches_fresh_hmac(mock_get_keys):
+    import hashlib
+    import hmac
+    ok = MagicMock(status_code=200, headers={}, content=b"{}")
+    with patch("binance_trade_api._SESSION.get", return_value=ok) as m:
+        bta._signed_request("k", "secret", "GET", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+    qs, sig = m.call_args[0][0].split("?", 1)[1].split("&signature=")
+    assert sig == hmac.new(b"secret", qs.encode(), hashlib.sha256).hexdigest()
+
+
+@pytest.mark.unit
+def test_signed_request_non_json_error_body(mock_get_keys):
+    bad = MagicMock(status_code=502, headers={}, content=b"<html>Bad Gateway</html>")
+    with patch("binance_trade_api._SESSION.get", return_value=bad):
+        with pytest.raises(RuntimeError, match="Bad Gateway"):
+            bta._signed_request("k", "secret", "GET", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+
+
+@pytest.mark.unit
+def test_signed_request_skips_debug_trace_at_info(mock_get_keys, isolated_trade_log):
+    import logging
+    log = bta._get_trade_logger()
+    level = log.level
+    log.setLevel(logging.INFO)
+    ok = MagicMock(status_code=200, headers={}, content=b"{}")
+    try:
+        with patch("binance_trade_api._SESSION.get", return_value=ok), patch.object(log, "debug") as debug:
+            bta._signed_request("k", "secret", "GET", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+    finally:
+        log.setLevel(level)
+    debug.assert_not_called()
+
+
+@pytest.mark.unit
+def test_signed_request_without_params_signs_timestamp_only(mock_get_keys):
+    ok = MagicMock(status_code=200, headers={}, content=b"[]")
+    with patch("binance_trade_api._SESSION.get", return_value=ok) as m:
+        bta._signed_request("k", "secret", "GET", "/fapi/v2/positionRisk")
+    qs = m.call_args[0][0].split("?", 1)[1]
+    assert qs.startswith("timestamp=")
+    assert qs.count("&") == 1
+
+
 @pytest.mark.unit
 def test_get_mark_price_http_error():
-    with patch("binance_trade_api.requests.get") as m:
+    with patch("binance_trade_api._SESSION.get") as m:
         resp = MagicMock()
         resp.status_code = 404
         resp.raise_for_status.side_effect = Exception("404")
         m.return_value = resp
         with pytest.raises(Exception):
             bta._get_mark_price("BTCUSDT")
+
+
+@pytest.mark.unit
+def test_loads_parses_bytes_with_and_without_orjson():
+    body = b'{"symbol": "BTCUSDT", "price": "50000.5"}'
+    assert bta._loads(body) == {"symbol": "BTCUSDT", "price": "50000.5"}
+    with patch.object(bta, "orjson", None):
+        assert bta._loads(body) == {"symbol": "BTCUSDT", "price": "50000.5"}
+        (key,) = bta._loads(b'[{"clientOrderId": "a"}]')[0]
+        assert key is sys.intern("clientOrderId")
+
+
+@pytest.mark.unit
+def test_dumps_indent_with_and_without_orjson():
+    import json
+    obj = {"orderId": 1, "symbol": "BTCUSDT"}
+    for mod in (bta.orjson, None):
+        with patch.object(bta, "orjson", mod):
+            assert json.loads(bta._dumps(obj)) == obj
+            assert bta._dumps(obj, indent=True) == json.dumps(obj, indent=2)
+
+
+# ---------- TC-13: _RateLimiter (unit) ----------
+@pytest.mark.unit
+def test_rate_limiter_no_wait_below_threshold():
+    limiter = bta._RateLimiter()
+    with patch("binance_trade_api.time.time", return_value=1_000_020.0):
+        limiter.update({"X-MBX-USED-WEIGHT-1M": "100", "X-MBX-ORDER-COUNT-10S": "5"})
+        assert limiter._wait_time(orders=1, now=1_000_020.0) == 0.0
+
+
+@pytest.mark.unit
+def test_rate_limiter_waits_for_weight_window_over_threshold():
+    limiter = bta._RateLimiter()
+    now = 1_000_040.0  # 20s into a wall-clock minute
+    with patch("binance_trade_api.time.time", return_value=now):
+        limiter.update({"X-MBX-USED-WEIGHT-1M": str(bta.RATE_LIMIT_WEIGHT_1M)})
+    assert limiter._wait_time(orders=0, now=now) == pytest.approx(40.0)
+    # Usage from a previous window no longer counts
+    assert limiter._wait_time(orders=0, now=now + 60) == 0.0
+
+
+@pytest.mark.unit
+def test_rate_limiter_order_count_gates_only_order_requests():
+    limiter = bta._RateLimiter()
+    now = 1_000_003.0
+    with patch("binance_trade_api.time.time", return_value=now):
+        limiter.update({"X-MBX-ORDER-COUNT-10S": str(bta.RATE_LIMIT_ORDERS_10S)})
+    assert limiter._wait_time(orders=0, now=now) == 0.0
+    assert limiter._wait_time(orders=1, now=now) == pytest.approx(7.0)
+
+
+@pytest.mark.integration
+def test_signed_request_retries_after_429(mock_get_keys, isolated_trade_log):
+    limited = MagicMock(status_code=429, headers={"Retry-After": "0"})
+    ok = MagicMock(status_code=200, headers={"X-MBX-USED-WEIGHT-1M": "1"})
+    ok.content = b'{"orderId": 1}'
+    with patch("binance_trade_api._SESSION.post", side_effect=[limited, ok]) as m, \
+            patch("binance_trade_api.time.sleep"):
+        status, data = bta._signed_request("k", "s", "POST", "/fapi/v1/order", {"symbol": "BTCUSDT"})
+    assert status == 200
+    assert data == {"orderId": 1}
+    assert m.call_count == 2
+    assert "Binance 429 on POST /fapi/v1/order" in isolated_trade_log.read_text(encoding="utf-8")
+
+
+@pytest.mark.integration
+def test_signed_request_post_sends_params_in_body(mock_get_keys):
+    ok = MagicMock(status_code=200, headers={}, content=b'{"orderId": 1}')
+    with patch("binance_trade_api._SESSION.post", return_value=ok) as m:
+        bta._signed_request("k", "s", "POST", "/fapi/v1/order", {"symbol": "BTCUSDT", "side": "BUY"})
+    url = m.call_args[0][0]
+    kwargs = m.call_args[1]
+    assert url == f"{bta.BINANCE_FUTURES_BASE}/fapi/v1/order"
+    assert kwargs["data"].startswith("symbol=BTCUSDT&side=BUY&timestamp=")
+    assert "&signature=" in kwargs["data"]
+    assert kwargs["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+@pytest.mark.unit
+def test_fast_qs_matches_urlencode():
+    from urllib.parse import urlencode
+    plain = {"symbol": "BTCUSDT", "side": "BUY", "quantity": "0.001", "reduceOnly": "true"}
+    assert bta._fast_qs(plain) == urlencode(plain)
+    batch = {"batchOrders": '[{"symbol":"BTCUSDT","side":"BUY"}]'}
+    assert bta._fast_qs(batch) == urlencode(batch)
+
+
+@pytest.mark.unit
+def test_session_adapter_leaves_429_to_signed_request():
+    retry = bta._SESSION.get_adapter("https://fapi.binance.com").max_retries
+    assert 429 not in retry.status_forcelist
+    assert retry.respect_retry_after_header is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("indent", [False, True])
+def test_dumps_stdlib_fallback_matches_orjson(monkeypatch, indent):
+    obj = {"orderId": 1, "symbol": "BTCUSDT", "fills": [{"qty": "0.001"}], "note": "\u00e9"}
+    expected = bta._dumps(obj, indent=indent)
+    monkeypatch.setattr(bta, "orjson", None)
+    assert bta._dumps(obj, indent=indent) == expected
+
+
+# ---------- TC-14: background order_status_audit writer (integration, tmp file) ----------
+@pytest.mark.integration
+def test_audit_writer_appends_queued_rows(tmp_path):
+    import csv
+    import json
+    audit_path = tmp_path / "orders" / "order_status_audit.csv"
+
+    def _item(order_id):
+        order = {"orderId": order_id, "symbol": "BTCUSDT"}
+        return bta._order_response_to_audit_row(order), {"event_type": "placed", "order": order}
+
+    with patch.object(bta, "ORDER_STATUS_AUDIT_PATH", audit_path):
+        bta._ensure_audit_writer()
+        for order_id in (1, 2, 3):
+            bta._AUDIT_Q.put(_item(order_id))
+        bta.flush_order_status_audit()
+        # Second batch reuses the open handles; header is written only once
+        bta._AUDIT_Q.put(_item(4))
+        bta.flush_order_status_audit()
+        bta._close_audit_file()
+    with open(audit_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["order_id"] for r in rows] == ["1", "2", "3", "4"]
+    assert rows[0]["symbol"] == "BTCUSDT"
+    lines = audit_path.with_suffix(".ndjson").read_bytes().splitlines()
+    assert [json.loads(line)["order"]["orderId"] for line in lines] == [1, 2, 3, 4]
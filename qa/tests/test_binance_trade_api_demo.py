@@ -25,6 +25,7 @@ import binance_trade_api as bta
 
 def _audit_contains_order_id(order_id: int) -> bool:
     """Return True if order_status_audit.csv has a row with this order_id."""
+    bta.flush_order_status_audit()
     path = bta.ORDER_STATUS_AUDIT_PATH
     if not path.exists():
         return False
@@ -16,6 +16,7 @@ Then point the React app at http://localhost:8000 (default).
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
 import hmac
 import json
@@ -156,7 +157,7 @@ def _get_funding_symbols() -> List[str]:
     """Symbols to fetch funding rate for (e.g. BTCUSDT). From positions.csv coins or fallback."""
     if POSITIONS_PATH.exists():
         try:
-            with open(POSITIONS_PATH, newline="") as f:
+            with open(POSITIONS_PATH, newline="", encoding="utf-8") as f:
                 reader = csv.DictReader(f)
                 coins = [(r.get("coin") or "").strip() for r in reader if (r.get("coin") or "").strip()]
             if coins:
@@ -643,6 +644,19 @@ def _funding_market_data_loop() -> None:
     sys.stderr.write("[backend_server] Funding market data loop stopped.\n")
 
 
+@functools.lru_cache(maxsize=None)
+def _precision_from_step(step: str) -> str:
+    """Decimal places implied by a tickSize/stepSize string ("0.0100" -> "2", "1" -> "0").
+
+    Cached: the same few step strings recur across hundreds of exchangeInfo symbols.
+    """
+    step = step.strip()
+    dot = step.find(".")
+    if dot == -1:
+        return "0"
+    return str(len(step.rstrip("0")) - dot - 1)
+
+
 def _parse_leverage_brackets(bracket_list: list) -> dict:
     """Build symbol -> max leverage from leverageBracket response."""
     out: dict = {}
@@ -692,20 +706,11 @@ def _fetch_and_write_market_data() -> None:
             if s.get("contractType") != "PERPETUAL" or not sym.endswith("USDT"):
                 continue
             symbols.append(sym)
-            tick_size = None
-            for flt in s.get("filters", []) or []:
-                if flt.get("filterType") == "PRICE_FILTER":
-                    tick_size = flt.get("tickSize")
-                    break
-            prec_str = ""
-            if tick_size is not None:
-                step = str(tick_size).strip()
-                if "." in step:
-                    frac = step.rstrip("0").split(".")[1]
-                    prec_str = str(len(frac))
-                else:
-                    prec_str = "0"
-            price_precision_by_sym[sym] = prec_str
+            tick_size = next(
+                (flt.get("tickSize") for flt in s.get("filters", []) or [] if flt.get("filterType") == "PRICE_FILTER"),
+                None,
+            )
+            price_precision_by_sym[sym] = "" if tick_size is None else _precision_from_step(str(tick_size))
         sys.stderr.write(f"[backend_server] Market data: exchangeInfo ok, {len(symbols)} USDT perpetual symbols\n")
     except Exception as e:
         sys.stderr.write(f"[backend_server] Market data exchangeInfo: {e}\n")
@@ -936,7 +941,7 @@ def create_app() -> Flask:
     def _read_positions() -> List[dict]:
         if not POSITIONS_PATH.exists():
             return []
-        with open(POSITIONS_PATH, newline="") as f:
+        with open(POSITIONS_PATH, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             rows = list(reader)
         # Merge funding rate estimates (72h avg as day rate, latest as day rate)
@@ -1001,7 +1006,7 @@ def create_app() -> Flask:
         UI_ORDERS_PATH.parent.mkdir(parents=True, exist_ok=True)
         ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         audit_path = UI_ORDERS_PATH.parent / f"order_{ts}.csv"
-        with open(audit_path, "w", newline="") as f:
+        with open(audit_path, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             writer.writerows(rows)
@@ -1010,7 +1015,7 @@ def create_app() -> Flask:
     def _read_summary_last_row() -> dict:
         if not SUMMARY_PATH.exists():
             return {}
-        with open(SUMMARY_PATH, newline="") as f:
+        with open(SUMMARY_PATH, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             rows = list(reader)
         return rows[-1] if rows else {}
@@ -1024,7 +1029,7 @@ def create_app() -> Flask:
         """
         if not SUMMARY_PATH.exists():
             return []
-        with open(SUMMARY_PATH, newline="") as f:
+        with open(SUMMARY_PATH, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             rows = list(reader)
         if not rows:
@@ -1249,7 +1254,7 @@ def create_app() -> Flask:
         resolved = _resolve_direct_for_orders(dict_rows, currency_key="currency")
         UI_ORDERS_PATH.parent.mkdir(parents=True, exist_ok=True)
         file_exists = UI_ORDERS_PATH.exists()
-        with open(UI_ORDERS_PATH, "a", newline="") as f:
+        with open(UI_ORDERS_PATH, "a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=ORDERS_FIELDNAMES, extrasaction="ignore")
             if not file_exists:
                 writer.writeheader()
@@ -1270,7 +1275,7 @@ def create_app() -> Flask:
         file_exists = ORDER_HISTORY_PATH.exists()
         fieldnames = ["timestamp", "source", "num_orders", "returncode", "stdout", "stderr", "input_csv"]
         now_ts = datetime.utcnow().isoformat() + "Z"
-        with open(ORDER_HISTORY_PATH, "a", newline="") as f:
+        with open(ORDER_HISTORY_PATH, "a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             if not file_exists:
                 writer.writeheader()
@@ -1761,7 +1766,7 @@ def create_app() -> Flask:
         resolved = _resolve_direct_for_orders(batch, currency_key="currency")
         UI_ORDERS_PATH.parent.mkdir(parents=True, exist_ok=True)
         file_exists = UI_ORDERS_PATH.exists()
-        with open(UI_ORDERS_PATH, "a", newline="") as f:
+        with open(UI_ORDERS_PATH, "a", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(f, fieldnames=ORDERS_FIELDNAMES, extrasaction="ignore")
             if not file_exists:
                 writer.writeheader()
@@ -2341,7 +2346,7 @@ def create_app() -> Flask:
         """Symbols to query for order history: only those with open position, to avoid rate limit (418)."""
         if POSITIONS_PATH.exists():
             try:
-                with open(POSITIONS_PATH, newline="") as f:
+                with open(POSITIONS_PATH, newline="", encoding="utf-8") as f:
                     reader = csv.DictReader(f)
                     symbols = []
                     for row in reader:
@@ -2715,7 +2720,7 @@ def create_app() -> Flask:
         rows = [{"symbol": sym, "fraction": "1.0", "order_type": order_type, "price": price_val} for sym in symbols]
         ORDER_CLOSE_TEMPLATE_PATH.parent.mkdir(parents=True, exist_ok=True)
         try:
-            with open(ORDER_CLOSE_TEMPLATE_PATH, "w", newline="") as f:
+            with open(ORDER_CLOSE_TEMPLATE_PATH, "w", newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(f, fieldnames=["symbol", "fraction", "order_type", "price"])
                 writer.writeheader()
                 writer.writerows(rows)
@@ -2840,6 +2845,12 @@ def create_app() -> Flask:
             if "Binance error" in msg:
                 return {"error": msg, "ok": False, "responses": []}, 200
             return {"error": msg, "ok": False, "responses": []}, 500
+        # A failed batchOrders chunk comes back as {"error": ...} entries while the other chunks'
+        # orders are live, so report it as a failure but still return every response.
+        failed = [r["error"] for r in responses if isinstance(r, dict) and r.get("error")]
+        if failed:
+            msg = f"{len(failed)} of {len(responses)} orders failed: {failed[0]}"
+            return {"error": msg, "ok": False, "responses": responses}, 200
         return {"ok": True, "responses": responses}, 200
 
     @app.post("/api/compose-orders")
@@ -3144,7 +3155,7 @@ def create_app() -> Flask:
             # Resolve Close -> SELL/BUY from positions (Binance has no Close side), then overwrite ui_orders.csv and write audit
             resolved_out = _resolve_direct_for_orders(rows_out, currency_key="currency")
             UI_ORDERS_PATH.parent.mkdir(parents=True, exist_ok=True)
-            with open(UI_ORDERS_PATH, "w", newline="") as f:
+            with open(UI_ORDERS_PATH, "w", newline="", encoding="utf-8") as f:
                 writer = csv.DictWriter(f, fieldnames=ORDERS_FIELDNAMES, extrasaction="ignore")
                 writer.writeheader()
                 for row in resolved_out:
@@ -30,25 +30,43 @@ This will:
 - Place a MARKET order in USD-M futures with `quoteOrderQty = size_usdt`
 """
 
+import atexit
 import csv
+import functools
 import hashlib
 import hmac
+import itertools
 import json
 import logging
-import math
+import logging.handlers
+import operator
+import queue
+import re
 import sys
+import threading
 import time
 import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import ROUND_DOWN, Decimal
 from pathlib import Path
 from urllib.parse import urlencode
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json parses bytes too
+    orjson = None
 
 from env_manager import (
     BINANCE_FUTURES_BASE,
     BINANCE_API_KEY,
     BINANCE_API_SECRET,
+    BINANCE_DEBUG_REQUESTS,
     ORDER_STATUS_AUDIT_PATH,
 )
 
@@ -57,12 +75,15 @@ TRADE_LOG_PATH = ORDER_STATUS_AUDIT_PATH.parent / "binance_trade_api.log"
 
 
 def _get_trade_logger() -> logging.Logger:
-    """Return a logger that writes to data/binance/orders/binance_trade_api.log."""
+    """Return a logger that writes to data/binance/orders/binance_trade_api.log.
+
+    Per-request DEBUG lines are only recorded when BINANCE_DEBUG_REQUESTS is set; otherwise INFO and up.
+    """
     name = "binance_trade_api"
     log = logging.getLogger(name)
     if log.handlers:
         return log
-    log.setLevel(logging.DEBUG)
+    log.setLevel(logging.DEBUG if BINANCE_DEBUG_REQUESTS else logging.INFO)
     TRADE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     fh = logging.FileHandler(TRADE_LOG_PATH, encoding="utf-8")
     fh.setLevel(logging.DEBUG)
@@ -70,6 +91,96 @@ def _get_trade_logger() -> logging.Logger:
     log.addHandler(fh)
     return log
 
+
+_stderr_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _get_stderr_logger() -> logging.Logger:
+    """Return a logger for per-row failure messages shown on stderr (and propagated to the trade log).
+
+    Worker threads only enqueue records; a single QueueListener thread writes them to stderr, so
+    concurrent close-template failures never interleave or contend on the stderr lock.
+    """
+    global _stderr_listener
+    log = logging.getLogger("binance_trade_api.stderr")
+    if log.handlers:
+        return log
+    _get_trade_logger()
+    q: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    sh = logging.StreamHandler(sys.stderr)
+    sh.setFormatter(logging.Formatter("%(message)s"))
+    _stderr_listener = logging.handlers.QueueListener(q, sh)
+    _stderr_listener.start()
+    log.addHandler(logging.handlers.QueueHandler(q))
+    return log
+
+
+def _stop_stderr_logger() -> None:
+    """Drain queued stderr records before the interpreter exits."""
+    if _stderr_listener is not None:
+        _stderr_listener.stop()
+
+
+atexit.register(_stop_stderr_logger)
+
+# ── Shared HTTP session: keep-alive connections to the futures host are reused across requests ──
+def _make_session() -> requests.Session:
+    """requests.Session with a pooled HTTPS adapter; idempotent GETs retry connect errors and transient 5xx.
+
+    429/418 are deliberately not retried here: _signed_request handles them through _RATE_LIMITER and
+    re-signs each attempt with a fresh timestamp, whereas an adapter retry would resend the stale one.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+        # Hand the final response back so _signed_request can raise its own error.
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retry))
+    session.headers.update({"Connection": "keep-alive", "Accept-Encoding": "gzip"})
+    return session
+
+
+_SESSION = _make_session()
+
+
+def _intern_keys(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """object_pairs_hook: intern keys so the ~20 fields repeated in every order response are shared objects."""
+    return {sys.intern(k): v for k, v in pairs}
+
+
+def _loads(body: bytes) -> Any:
+    """Parse a JSON response body (raw bytes) with orjson when installed, else stdlib json.
+
+    orjson caches keys itself; the stdlib fallback interns them via _intern_keys.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body, object_pairs_hook=_intern_keys)
+
+
+# Pretty-print JSON responses only for interactive terminals; piped/logged CLI output stays compact.
+_INDENT = bool(sys.stdout is not None and sys.stdout.isatty())
+
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON str (2-space indented if requested) with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    # Same text as orjson either way: compact separators (indent=2 already matches OPT_INDENT_2), raw UTF-8.
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _emit(*lines: str) -> None:
+    """Write lines to stdout as one buffer so concurrent close workers never interleave partial output."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 # ── Hardcoded order defaults (previously from order_meta.csv) ──
 ORDER_DEFAULTS = {
     "leverage": 2,
@@ -82,54 +193,113 @@ ORDER_DEFAULTS = {
 _qty_precision_cache: Dict[str, int] = {}
 
 # ── Symbol resolution: user input (e.g. HYPE, HYPEUSDT) -> Binance symbol (e.g. 1000HYPEUSDT) ──
-_valid_usdt_symbols: set = set()
-_base_to_symbol: Dict[str, str] = {}
+# Every accepted spelling (canonical symbol, base asset, base+USDT, base without the "1000" prefix)
+# maps straight to the canonical symbol, so resolve_symbol is a single dict probe.
+_symbol_lookup: Dict[str, str] = {}
+
+
+def _build_symbol_lookup(symbols: List[str], base_to_symbol: Dict[str, str]) -> Dict[str, str]:
+    """Precompute the resolve_symbol table; later layers take precedence over earlier ones."""
+    lookup: Dict[str, str] = {}
+    # Lowest precedence: bare stem whose stem+USDT is listed (e.g. BTC -> BTCUSDT)
+    for sym in symbols:
+        stem = sym[:-4]
+        if sym.endswith("USDT") and stem and not stem.endswith("USDT"):
+            lookup[stem] = sym
+    # Base assets (incl. shortened 1000x bases), with or without the USDT suffix
+    for base, sym in base_to_symbol.items():
+        if not base.endswith("USDT"):
+            lookup[base] = sym
+        lookup[base + "USDT"] = sym
+    # Highest precedence: listed symbols resolve to themselves
+    for sym in symbols:
+        lookup[sym] = sym
+    return lookup
+
+
+_symbol_lookup_lock = threading.Lock()
 
 
 def _load_exchange_symbols() -> None:
-    """Fetch exchangeInfo and populate _valid_usdt_symbols and _base_to_symbol (and _qty_precision_cache)."""
-    global _valid_usdt_symbols, _base_to_symbol, _qty_precision_cache
-    if _valid_usdt_symbols:
+    """Fetch exchangeInfo once and populate _symbol_lookup (and _qty_precision_cache).
+
+    Safe to call from worker threads: concurrent first callers wait for a single fetch.
+    """
+    global _symbol_lookup
+    if _symbol_lookup:
         return
+    with _symbol_lookup_lock:
+        if _symbol_lookup:
+            return
+        _fetch_exchange_symbols()
+
+
+def _public_get(url: str, **kwargs: Any) -> requests.Response:
+    """Unsigned GET on _SESSION, paced by and reported to _RATE_LIMITER (public endpoints share the IP weight)."""
+    _RATE_LIMITER.wait()
+    r = _SESSION.get(url, timeout=15, **kwargs)
+    _RATE_LIMITER.update(r.headers)
+    return r
+
+
+def _fetch_exchange_symbols() -> None:
+    global _symbol_lookup
     try:
         url = f"{BINANCE_FUTURES_BASE}/fapi/v1/exchangeInfo"
-        r = requests.get(url, timeout=15)
+        r = _public_get(url)
         r.raise_for_status()
-        data = r.json()
+        data = _loads(r.content)
+        symbols: List[str] = []
+        base_to_symbol: Dict[str, str] = {}
         for s in data.get("symbols", []):
             sym = (s.get("symbol") or "").strip()
             base = (s.get("baseAsset") or "").strip()
             quote = (s.get("quoteAsset") or "").strip()
             if not sym or quote != "USDT" or (s.get("status") or "").upper() != "TRADING":
                 continue
-            _valid_usdt_symbols.add(sym)
+            symbols.append(sym)
             _qty_precision_cache[sym] = int(s.get("quantityPrecision", 3))
-            _base_to_symbol[base] = sym
+            if base:
+                base_to_symbol[base] = sym
             # Map shortened base to symbol (e.g. HYPE -> 1000HYPEUSDT when base is 1000HYPE)
             if base.startswith("1000") and len(base) > 4:
-                _base_to_symbol[base[4:]] = sym
+                base_to_symbol[base[4:]] = sym
+        _symbol_lookup = _build_symbol_lookup(symbols, base_to_symbol)
     except Exception as e:
         print(f"Warning: failed to fetch exchangeInfo: {e}", file=sys.stderr)
 
 
+_USDT = "USDT"
+
+
+def _usdt_symbol(raw: Optional[str]) -> str:
+    """Normalize user symbol input to upper case with a USDT suffix (e.g. ' btc ' -> BTCUSDT).
+
+    Input that is already upper-case ASCII alphanumerics (the common CLI/CSV case) skips strip/upper.
+    """
+    s = raw or ""
+    if not (s.isascii() and s.isalnum() and s.isupper()):
+        s = s.strip().upper()
+    return s if s.endswith(_USDT) else s + _USDT
+
+
+@functools.lru_cache(maxsize=4096)
 def resolve_symbol(user_input: str) -> str:
     """Convert user symbol (e.g. HYPE, HYPEUSDT) to Binance futures symbol (e.g. 1000HYPEUSDT).
 
     Uses exchangeInfo so that names like HYPE resolve to 1000HYPEUSDT when that is how Binance lists them.
+    Results are memoized; unknown symbols raise and are not cached.
     """
     user_input = (user_input or "").strip().upper()
     if not user_input:
         raise ValueError("Empty symbol")
     _load_exchange_symbols()
-    if user_input in _valid_usdt_symbols:
-        return user_input
-    base = user_input[:-4] if user_input.endswith("USDT") else user_input
-    if base in _base_to_symbol:
-        return _base_to_symbol[base]
-    candidate = base + "USDT"
-    if candidate in _valid_usdt_symbols:
-        return candidate
-    raise ValueError(f"Unknown or unsupported symbol: {user_input!r} (not in Binance USD-M futures)")
+    try:
+        return _symbol_lookup[user_input]
+    except KeyError:
+        raise ValueError(
+            f"Unknown or unsupported symbol: {user_input!r} (not in Binance USD-M futures)"
+        ) from None
 
 
 def _fetch_quantity_precision(symbol: str) -> int:
@@ -145,6 +315,95 @@ def _fetch_quantity_precision(symbol: str) -> int:
     return _qty_precision_cache.get(symbol, 3)
 
 
+# ── Client-side rate limiting (driven by Binance X-MBX-* response headers) ──
+# USD-M futures limits: 2400 request weight / minute, 300 orders / 10s, 1200 orders / minute.
+RATE_LIMIT_WEIGHT_1M = 2400
+RATE_LIMIT_ORDERS_10S = 300
+RATE_LIMIT_ORDERS_1M = 1200
+RATE_LIMIT_THRESHOLD = 0.8
+
+
+class _RateLimiter:
+    """Track used weight / order counts reported by Binance and sleep before a request would exceed them.
+
+    Binance reports usage for fixed wall-clock windows (X-MBX-USED-WEIGHT-1M, X-MBX-ORDER-COUNT-10S,
+    X-MBX-ORDER-COUNT-1M). Once usage crosses RATE_LIMIT_THRESHOLD of a limit, callers wait for the
+    window to roll over instead of being answered with 429 (and eventually 418 IP bans).
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # window length (s) -> (window start, count); window start is aligned to the wall clock
+        self.used_weight_1m: Tuple[float, int] = (0.0, 0)
+        self.order_count_10s: Tuple[float, int] = (0.0, 0)
+        self.order_count_1m: Tuple[float, int] = (0.0, 0)
+        self.blocked_until = 0.0
+
+    @staticmethod
+    def _window_start(now: float, length: float) -> float:
+        return now - (now % length)
+
+    def _current(self, counter: Tuple[float, int], now: float, length: float) -> int:
+        start, count = counter
+        return count if start == self._window_start(now, length) else 0
+
+    def _wait_time(self, orders: int, now: float) -> float:
+        wait = max(0.0, self.blocked_until - now)
+        if self._current(self.used_weight_1m, now, 60) > RATE_LIMIT_THRESHOLD * RATE_LIMIT_WEIGHT_1M:
+            wait = max(wait, 60 - (now % 60))
+        if orders:
+            if self._current(self.order_count_10s, now, 10) + orders > RATE_LIMIT_THRESHOLD * RATE_LIMIT_ORDERS_10S:
+                wait = max(wait, 10 - (now % 10))
+            if self._current(self.order_count_1m, now, 60) + orders > RATE_LIMIT_THRESHOLD * RATE_LIMIT_ORDERS_1M:
+                wait = max(wait, 60 - (now % 60))
+        return wait
+
+    def wait(self, orders: int = 0) -> None:
+        """Block until a request placing `orders` orders fits in the current budgets."""
+        with self._lock:
+            wait = self._wait_time(orders, time.time())
+        if wait > 0:
+            _get_trade_logger().warning("Rate limit: sleeping %.2fs before next request", wait)
+            time.sleep(wait)
+
+    def update(self, headers: Any) -> None:
+        """Record usage from a response's X-MBX-* headers."""
+        now = time.time()
+        with self._lock:
+            for header, attr, length in (
+                ("X-MBX-USED-WEIGHT-1M", "used_weight_1m", 60),
+                ("X-MBX-ORDER-COUNT-10S", "order_count_10s", 10),
+                ("X-MBX-ORDER-COUNT-1M", "order_count_1m", 60),
+            ):
+                value = headers.get(header)
+                if value is None:
+                    continue
+                try:
+                    count = int(value)
+                except (TypeError, ValueError):
+                    continue
+                start = self._window_start(now, length)
+                # Concurrent responses can arrive out of order; keep the highest count seen in this window.
+                setattr(self, attr, (start, max(count, self._current(getattr(self, attr), now, length))))
+
+    def backoff(self, retry_after: Optional[str]) -> float:
+        """Honor a 429/418 Retry-After header (seconds); returns the delay that was applied."""
+        try:
+            delay = float(retry_after) if retry_after else 1.0
+        except ValueError:
+            delay = 1.0
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.time() + delay)
+        return delay
+
+
+_RATE_LIMITER = _RateLimiter()
+# Order-placing endpoints count against the order-rate limits in addition to request weight.
+_ORDER_PATHS = frozenset(("/fapi/v1/order", "/fapi/v1/batchOrders"))
+# How many times a request rejected with 429 is retried after waiting out Retry-After.
+RATE_LIMIT_MAX_RETRIES = 2
+
+
 ORDER_STATUS_AUDIT_FIELDS = [
     "timestamp_utc",
     "event_type",
@@ -164,45 +423,125 @@ ORDER_STATUS_AUDIT_FIELDS = [
 
 
 
+# Characters urlencode() leaves untouched; values made only of these need no quoting.
+_QS_SAFE = re.compile(r"[A-Za-z0-9_.~-]*").fullmatch
+
+
+def _fast_qs(params: Dict[str, Any]) -> str:
+    """Query string for params, in insertion order.
+
+    Our signed params (symbol, side, quantity, price, flags) are plain ASCII tokens, so they are joined
+    directly; anything needing percent-encoding (e.g. the batchOrders JSON) falls back to urlencode.
+    """
+    parts = []
+    for k, v in params.items():
+        v = str(v)
+        if not (_QS_SAFE(k) and _QS_SAFE(v)):
+            return urlencode(params)
+        parts.append(k + "=" + v)
+    return "&".join(parts)
+
+
+@functools.lru_cache(maxsize=8)
+def _hmac_template(api_secret: str) -> "hmac.HMAC":
+    """HMAC-SHA256 keyed with api_secret; callers .copy() it so the key schedule is derived once."""
+    return hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
 def _signed_request(
     api_key: str,
     api_secret: str,
     method: str,
     path: str,
     params: Optional[Dict[str, str]] = None,
+    order_count: Optional[int] = None,
+    in_body: bool = True,
 ) -> Tuple[int, dict]:
-    """Generic signed request to Binance USD-M REST API."""
-    params = dict(params or {})
-    params["timestamp"] = str(int(time.time() * 1000))
-    # Use standard URL encoding so signature matches Binance expectations
-    qs = urlencode(sorted(params.items()))
-    sig = hmac.new(api_secret.encode("utf-8"), qs.encode("utf-8"), hashlib.sha256).hexdigest()
-    url = f"{BINANCE_FUTURES_BASE}{path}?{qs}&signature={sig}"
-    headers = {"X-MBX-APIKEY": api_key}
-    method = method.upper()
-    # Debug print of request (without secret) for troubleshooting
-    print(f"[Binance {_signed_request.__name__}] {method} {path} params={params}")
+    """Generic signed request to Binance USD-M REST API.
 
-    if method == "GET":
-        r = requests.get(url, headers=headers, timeout=15)
-    elif method == "POST":
-        r = requests.post(url, headers=headers, timeout=15)
-    else:
+    Paced by _RATE_LIMITER. order_count is the number of orders the request places; it defaults
+    to 1 for POST /fapi/v1/order and /fapi/v1/batchOrders and 0 otherwise.
+    With in_body (default), POST sends the signed params form-encoded in the body instead of the URL,
+    which keeps large batchOrders payloads out of the request line.
+    """
+    method = method.upper()
+    if method not in ("GET", "POST"):
         raise ValueError(f"Unsupported method: {method}")
+    if order_count is None:
+        order_count = 1 if method == "POST" and path in _ORDER_PATHS else 0
+    url = f"{BINANCE_FUTURES_BASE}{path}"
+    headers = {"X-MBX-APIKEY": api_key}
+    post_headers = {**headers, "Content-Type": "application/x-www-form-urlencoded"}
+    # Caller params are URL-encoded once per request, in insertion order; only the trailing timestamp
+    # changes between retries. Binance verifies the signature over the exact string sent, so no sort
+    # is needed. The HMAC absorbs the fixed prefix once; each attempt copies it and adds the timestamp.
+    param_qs = _fast_qs(params) if params else ""
+    qs_prefix = f"{param_qs}&timestamp=" if param_qs else "timestamp="
+    prefix_mac = _hmac_template(api_secret).copy()
+    prefix_mac.update(qs_prefix.encode("utf-8"))
+    log = _get_trade_logger()
+
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        _RATE_LIMITER.wait(order_count)
+        ts = str(time.time_ns() // 1_000_000)
+        h = prefix_mac.copy()
+        h.update(ts.encode("ascii"))
+        # Assembled in one join straight from the parts; no intermediate unsigned query string.
+        signed_qs = "".join((qs_prefix, ts, "&signature=", h.hexdigest()))
+        # Request trace (without signature/secret), only when BINANCE_DEBUG_REQUESTS is set: to the trade
+        # log and stdout. The isEnabledFor guard keeps the default path free of formatting and file writes.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("%s %s params=%s%s", method, path, qs_prefix, ts)
+            print(f"[Binance {_signed_request.__name__}] {method} {path} params={qs_prefix}{ts}")
+
+        if method == "GET":
+            r = _SESSION.get("".join((url, "?", signed_qs)), headers=headers, timeout=15)
+        elif in_body:
+            r = _SESSION.post(url, data=signed_qs, headers=post_headers, timeout=15)
+        else:
+            r = _SESSION.post("".join((url, "?", signed_qs)), headers=headers, timeout=15)
+        _RATE_LIMITER.update(r.headers)
+        if r.status_code not in (418, 429):
+            break
+        delay = _RATE_LIMITER.backoff(r.headers.get("Retry-After"))
+        log.warning(
+            "Binance %s on %s %s; Retry-After %.0fs (attempt %d)", r.status_code, method, path, delay, attempt + 1
+        )
+        # 418 means the IP is already banned; retrying only extends the ban.
+        if r.status_code == 418:
+            break
     status = r.status_code
+    body = r.content
     try:
-        data = r.json()
+        data = _loads(body)
     except ValueError:
-        data = {"raw": r.text}
+        # Non-JSON bodies (e.g. HTML from a proxy): decode directly instead of r.text, which may run
+        # charset detection over the whole body when the response has no charset header.
+        data = {"raw": body.decode("utf-8", "replace")}
     if status >= 400:
         raise RuntimeError(f"Binance error {status}: {data}")
     return status, data
 
 
+# (epoch second, formatted UTC string): audit rows only carry second resolution, so format once per second.
+_utc_stamp: Tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as 'YYYY-MM-DD HH:MM:SS', reformatted at most once per second."""
+    global _utc_stamp
+    now = int(time.time())
+    stamp = _utc_stamp
+    if stamp[0] != now:
+        stamp = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(now)))
+        _utc_stamp = stamp
+    return stamp[1]
+
+
 def _order_response_to_audit_row(o: dict, event_type: str = "placed", source: str = "api") -> Dict[str, str]:
     """Convert Binance order response (or GET order result) to one audit CSV row."""
     return {
-        "timestamp_utc": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+        "timestamp_utc": _utc_timestamp(),
         "event_type": event_type,
         "order_id": str(o.get("orderId") or o.get("order_id") or ""),
         "client_order_id": str(o.get("clientOrderId") or o.get("client_order_id") or ""),
@@ -218,6 +557,102 @@ def _order_response_to_audit_row(o: dict, event_type: str = "placed", source: st
     }
 
 
+# ── Background audit writer: order placement enqueues rows, one daemon thread appends them ──
+# Each queue item is (CSV row, NDJSON record). The CSV is for human inspection; the NDJSON sidecar
+# (order_status_audit.ndjson next to the CSV) keeps the full Binance response for downstream analytics.
+_AUDIT_Q: "queue.Queue[Tuple[Dict[str, str], dict]]" = queue.Queue()
+_AUDIT_WRITE_BATCH = 64
+_AUDIT_BUFFER_BYTES = 64 * 1024
+_audit_writer_lock = threading.Lock()
+_audit_writer: Optional[threading.Thread] = None
+# Append-mode handles kept open by the writer thread (reopened if ORDER_STATUS_AUDIT_PATH changes)
+_audit_fh: Optional[TextIO] = None
+_audit_ndjson_fh: Optional[Any] = None
+_audit_fh_path: Optional[Path] = None
+_audit_csv: Optional[csv.DictWriter] = None
+
+
+def _ndjson_line(record: dict) -> bytes:
+    """One JSON document plus newline, as bytes (no CSV quoting/escaping pass)."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _close_audit_file() -> None:
+    global _audit_fh, _audit_ndjson_fh, _audit_fh_path, _audit_csv
+    for fh in (_audit_fh, _audit_ndjson_fh):
+        if fh is not None:
+            fh.close()
+    _audit_fh, _audit_ndjson_fh, _audit_fh_path, _audit_csv = None, None, None, None
+
+
+def _audit_csv_writer() -> csv.DictWriter:
+    """Return the DictWriter over the open audit handle, opening it (and the NDJSON sidecar) once."""
+    global _audit_fh, _audit_ndjson_fh, _audit_fh_path, _audit_csv
+    if _audit_csv is None or _audit_fh_path != ORDER_STATUS_AUDIT_PATH:
+        _close_audit_file()
+        ORDER_STATUS_AUDIT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(ORDER_STATUS_AUDIT_PATH, "a", newline="", encoding="utf-8", buffering=_AUDIT_BUFFER_BYTES)
+        writer = csv.DictWriter(fh, fieldnames=ORDER_STATUS_AUDIT_FIELDS, extrasaction="ignore")
+        if fh.tell() == 0:
+            writer.writeheader()
+        _audit_ndjson_fh = open(ORDER_STATUS_AUDIT_PATH.with_suffix(".ndjson"), "ab", buffering=_AUDIT_BUFFER_BYTES)
+        _audit_fh, _audit_fh_path, _audit_csv = fh, ORDER_STATUS_AUDIT_PATH, writer
+    return _audit_csv
+
+
+def _write_audit_rows(items: List[Tuple[Dict[str, str], dict]]) -> None:
+    """Append items to the audit CSV (one writerows) and NDJSON sidecar (one write), then flush both."""
+    _audit_csv_writer().writerows(row for row, _ in items)
+    _audit_ndjson_fh.write(b"".join(_ndjson_line(record) for _, record in items))
+    _audit_fh.flush()
+    _audit_ndjson_fh.flush()
+
+
+def _audit_writer_loop() -> None:
+    """Drain _AUDIT_Q forever, writing up to _AUDIT_WRITE_BATCH rows per append."""
+    while True:
+        items = [_AUDIT_Q.get()]
+        while len(items) < _AUDIT_WRITE_BATCH:
+            try:
+                items.append(_AUDIT_Q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_audit_rows(items)
+        except Exception:
+            _get_trade_logger().exception("Failed to write %d order_status_audit rows", len(items))
+            _close_audit_file()
+        finally:
+            for _ in items:
+                _AUDIT_Q.task_done()
+
+
+def _ensure_audit_writer() -> None:
+    global _audit_writer
+    if _audit_writer is not None:
+        return
+    with _audit_writer_lock:
+        if _audit_writer is None:
+            _audit_writer = threading.Thread(target=_audit_writer_loop, name="order-status-audit", daemon=True)
+            _audit_writer.start()
+
+
+def flush_order_status_audit() -> None:
+    """Block until every queued audit row has been written to order_status_audit.csv / .ndjson."""
+    if _audit_writer is not None:
+        _AUDIT_Q.join()
+
+
+def _shutdown_audit_writer() -> None:
+    flush_order_status_audit()
+    _close_audit_file()
+
+
+atexit.register(_shutdown_audit_writer)
+
+
 def append_order_status_audit(
     order_response: dict,
     event_type: str = "placed",
@@ -226,15 +661,20 @@ def append_order_status_audit(
     """
     Append one row to order_status_audit.csv for auditing (by order_id / client_order_id).
     Call after placing an order or after querying status via get_order (with event_type='status_check').
+    The full response is also appended to order_status_audit.ndjson.
+
+    The row is queued and written by a background thread; call flush_order_status_audit() before
+    reading the CSV back in the same process.
     """
     row = _order_response_to_audit_row(order_response, event_type=event_type, source=source)
-    ORDER_STATUS_AUDIT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    file_exists = ORDER_STATUS_AUDIT_PATH.exists()
-    with open(ORDER_STATUS_AUDIT_PATH, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=ORDER_STATUS_AUDIT_FIELDS, extrasaction="ignore")
-        if not file_exists:
-            writer.writeheader()
-        writer.writerow(row)
+    record = {
+        "timestamp_utc": row["timestamp_utc"],
+        "event_type": event_type,
+        "source": source,
+        "order": order_response,
+    }
+    _ensure_audit_writer()
+    _AUDIT_Q.put((row, record))
 
 
 def get_order(
@@ -267,7 +707,11 @@ def get_order(
     return data
 
 
+_printed_keys = False
+
+
 def _get_keys() -> Tuple[str, str]:
+    global _printed_keys
     if not BINANCE_API_KEY or not BINANCE_API_SECRET:
         print(
             "Set BINANCE_API_KEY and BINANCE_API_SECRET (or BINANCE_UM_API_*) in .env or environment.\n"
@@ -275,7 +719,9 @@ def _get_keys() -> Tuple[str, str]:
             file=sys.stderr,
         )
         sys.exit(1)
-    print(f"Using Binance key: {BINANCE_API_KEY[:4]}***{BINANCE_API_KEY[-4:]}")
+    if not _printed_keys:
+        print(f"Using Binance key: {BINANCE_API_KEY[:4]}***{BINANCE_API_KEY[-4:]}")
+        _printed_keys = True
     return BINANCE_API_KEY, BINANCE_API_SECRET
 
 
@@ -302,14 +748,95 @@ def set_leverage(
     return data
 
 
+# ── Mark price cache: symbol -> (time.monotonic() of fetch, price) ──
+MARK_PRICE_TTL_SECONDS = 0.5
+_mark_cache: Dict[str, Tuple[float, float]] = {}
+
+
 def _get_mark_price(symbol: str) -> float:
-    """Fetch current mark/last price for symbol from ticker endpoint."""
+    """Fetch current mark/last price for symbol from ticker endpoint.
+
+    Prices younger than MARK_PRICE_TTL_SECONDS are served from _mark_cache, so repeated rows for
+    the same symbol (e.g. scaling out in a close template) share one request.
+    """
     symbol = resolve_symbol(symbol)
+    cached = _mark_cache.get(symbol)
+    if cached is not None and time.monotonic() - cached[0] < MARK_PRICE_TTL_SECONDS:
+        return cached[1]
     url = f"{BINANCE_FUTURES_BASE}/fapi/v1/ticker/price"
-    r = requests.get(url, params={"symbol": symbol}, timeout=15)
+    r = _public_get(url, params={"symbol": symbol})
     r.raise_for_status()
-    data = r.json()
-    return float(data["price"])
+    data = _loads(r.content)
+    price = float(data["price"])
+    _mark_cache[symbol] = (time.monotonic(), price)
+    return price
+
+
+def _fetch_all_mark_prices() -> Dict[str, float]:
+    """Fetch prices for every symbol in one ticker request (same source as _get_mark_price).
+
+    Returns {} on failure so callers fall back to per-symbol _get_mark_price.
+    """
+    try:
+        r = _public_get(f"{BINANCE_FUTURES_BASE}/fapi/v1/ticker/price")
+        r.raise_for_status()
+        return {t["symbol"]: float(t["price"]) for t in _loads(r.content)}
+    except Exception as e:
+        _get_trade_logger().warning("Bulk price fetch failed, falling back to per-symbol: %s", e)
+        return {}
+
+
+# How long one bulk price snapshot may size orders on the CSV path before rows fall back to fresh
+# per-symbol prices (a long, rate-limited CSV should not size late rows off start-of-run prices).
+MARK_SNAPSHOT_MAX_AGE_SECONDS = 5.0
+
+
+class _MarkSnapshot:
+    """All-symbol prices shared by every row of a run, fetched with one request once a second symbol shows up.
+
+    Like place_batch_orders' len(...) > 1 guard: while a run has only touched one symbol, get() returns
+    None so the caller's per-symbol ticker request is used instead of the much heavier bulk one.
+    """
+
+    def __init__(self, max_age: float = MARK_SNAPSHOT_MAX_AGE_SECONDS) -> None:
+        self._lock = threading.Lock()
+        self._prices: Optional[Dict[str, float]] = None
+        self._first_symbol: Optional[str] = None
+        self._fetched_at = 0.0
+        self.max_age = max_age
+
+    def get(self, symbol: str) -> Optional[float]:
+        """Snapshot price for symbol, or None if unknown, the snapshot is too old, or only symbol so far."""
+        with self._lock:
+            if self._prices is None:
+                if self._first_symbol is None or self._first_symbol == symbol:
+                    self._first_symbol = symbol
+                    return None
+                self._prices = _fetch_all_mark_prices()
+                self._fetched_at = time.monotonic()
+        if time.monotonic() - self._fetched_at > self.max_age:
+            return None
+        return self._prices.get(symbol)
+
+
+def _fetch_positions(api_key: str, api_secret: str, symbol: Optional[str] = None) -> Dict[str, dict]:
+    """Open positions from /fapi/v2/positionRisk keyed by symbol (zero positionAmt rows dropped).
+
+    With symbol, Binance returns only that symbol's rows instead of the whole account. In hedge mode
+    the first non-zero side per symbol is kept.
+    """
+    _, rows = _signed_request(
+        api_key,
+        api_secret,
+        "GET",
+        "/fapi/v2/positionRisk",
+        {"symbol": symbol} if symbol else {},
+    )
+    positions: Dict[str, dict] = {}
+    for p in rows:
+        if float(p.get("positionAmt", 0) or 0) != 0:
+            positions.setdefault(str(p.get("symbol")), p)
+    return positions
 
 
 def close_position(
@@ -317,50 +844,37 @@ def close_position(
     fraction: float = 1.0,
     api_key: Optional[str] = None,
     api_secret: Optional[str] = None,
+    positions: Optional[Dict[str, dict]] = None,
 ) -> Optional[dict]:
     """
     Close all or part of the open position for a symbol using a MARKET reduce-only order.
 
     - symbol: e.g. BTCUSDT
     - fraction: 1.0 to close 100%, 0.5 to close 50%, etc. (clamped to [0, 1]).
-    - Uses /fapi/v2/positionRisk to detect current positionAmt.
+    - Uses /fapi/v2/positionRisk to detect current positionAmt, unless positions (a fresh
+      _fetch_positions snapshot) is given.
     - If no open position, returns None.
     """
     symbol = resolve_symbol(symbol)
     if api_key is None or api_secret is None:
         api_key, api_secret = _get_keys()
 
-    # Fetch current position for this symbol
-    _, positions = _signed_request(
-        api_key,
-        api_secret,
-        "GET",
-        "/fapi/v2/positionRisk",
-        {},
-    )
-    position = None
-    for p in positions:
-        if str(p.get("symbol")) == symbol:
-            amt = float(p.get("positionAmt", 0) or 0)
-            if amt != 0:
-                position = p
-                break
-
+    # Current position for this symbol (from the caller's snapshot, else a symbol-filtered fetch)
+    if positions is None:
+        positions = _fetch_positions(api_key, api_secret, symbol)
+    position = positions.get(symbol)
     if position is None:
-        print(f"No open position for {symbol}; nothing to close.")
+        _emit(f"No open position for {symbol}; nothing to close.")
         return None
 
     amt = float(position.get("positionAmt", 0) or 0)
-    if amt == 0:
-        print(f"Position size is zero for {symbol}; nothing to close.")
-        return None
     # Clamp fraction to [0, 1]
     try:
         frac = float(fraction)
     except (TypeError, ValueError):
         frac = 1.0
     if frac <= 0:
-        print(f"Fraction {fraction} <= 0; nothing to close for {symbol}.")
+        _emit(f"Fraction {fraction} <= 0; nothing to close for {symbol}.")
         return None
     if frac > 1:
         frac = 1.0
@@ -376,7 +890,7 @@ def close_position(
         "reduceOnly": "true",
         "quantity": qty_str,
     }
-    print(f"Closing position for {symbol}: side={side}, qty={qty_str} (MARKET)")
+    _emit(f"Closing position for {symbol}: side={side}, qty={qty_str} (MARKET)")
     _, data = _signed_request(api_key, api_secret, "POST", "/fapi/v1/order", params)
     append_order_status_audit(data, event_type="placed", source="close_position")
     return data
@@ -388,6 +902,7 @@ def close_position_limit(
     price: float,
     api_key: Optional[str] = None,
     api_secret: Optional[str] = None,
+    positions: Optional[Dict[str, dict]] = None,
 ) -> Optional[dict]:
     """
     Close all or part of the open position for a symbol using a LIMIT reduce-only order.
@@ -395,41 +910,28 @@ def close_position_limit(
     - symbol: e.g. BTCUSDT
     - fraction: 1.0 to close 100%, 0.5 to close 50%, etc. (clamped to [0, 1]).
     - price: limit price for the order.
+    - positions: optional _fetch_positions snapshot; fetched for this symbol when omitted.
     """
     symbol = resolve_symbol(symbol)
     if api_key is None or api_secret is None:
         api_key, api_secret = _get_keys()
 
-    _, positions = _signed_request(
-        api_key,
-        api_secret,
-        "GET",
-        "/fapi/v2/positionRisk",
-        {},
-    )
-    position = None
-    for p in positions:
-        if str(p.get("symbol")) == symbol:
-            amt = float(p.get("positionAmt", 0) or 0)
-            if amt != 0:
-                position = p
-                break
-
+    # Current position for this symbol (from the caller's snapshot, else a symbol-filtered fetch)
+    if positions is None:
+        positions = _fetch_positions(api_key, api_secret, symbol)
+    position = positions.get(symbol)
     if position is None:
-        print(f"No open position for {symbol}; nothing to close.")
+        _emit(f"No open position for {symbol}; nothing to close.")
         return None
 
     amt = float(position.get("positionAmt", 0) or 0)
-    if amt == 0:
-        print(f"Position size is zero for {symbol}; nothing to close.")
-        return None
     try:
         frac = float(fraction)
     except (TypeError, ValueError):
         frac = 1.0
     frac = max(0.0, min(1.0, frac))
     if frac <= 0:
-        print(f"Fraction {fraction} <= 0; nothing to close for {symbol}.")
+        _emit(f"Fraction {fraction} <= 0; nothing to close for {symbol}.")
         return None
 
     side = "SELL" if amt > 0 else "BUY"
@@ -451,7 +953,7 @@ def close_position_limit(
         "price": f"{price_rounded}",
         "reduceOnly": "true",
     }
-    print(f"Closing position for {symbol}: side={side}, qty={qty}, price={price_rounded} (LIMIT)")
+    _emit(f"Closing position for {symbol}: side={side}, qty={qty}, price={price_rounded} (LIMIT)")
     _, data = _signed_request(api_key, api_secret, "POST", "/fapi/v1/order", params)
     append_order_status_audit(data, event_type="placed", source="close_limit")
     return data
@@ -465,6 +967,7 @@ def place_market_order(
     quantity_precision: Optional[int] = None,
     api_key: Optional[str] = None,
     api_secret: Optional[str] = None,
+    price_hint: Optional[float] = None,
 ) -> dict:
     """
     Place a MARKET order on Binance USD-M futures using a USDT notional.
@@ -474,6 +977,7 @@ def place_market_order(
     - quote_usdt: notional size in USDT (float)
     - leverage: optional, set before placing the order
     - quantity_precision: optional, max decimal places for quantity
+    - price_hint: optional recent price used to size the order instead of fetching the ticker
     """
     symbol = resolve_symbol(symbol)
     if api_key is None or api_secret is None:
@@ -492,19 +996,12 @@ def place_market_order(
         raise ValueError("quote_usdt must be positive")
 
     # Derive contract quantity from notional and current price.
-    price = _get_mark_price(symbol)
+    price = price_hint if price_hint is not None else _get_mark_price(symbol)
     if price <= 0:
         raise RuntimeError(f"Got non-positive price for {symbol}: {price}")
     # Use symbol-specific precision from exchangeInfo; Binance rejects excess decimals.
-    raw_qty = notional / price
     prec = quantity_precision if quantity_precision is not None else _fetch_quantity_precision(symbol)
-    # Clamp precision to a sensible range
-    if prec < 0:
-        prec = 0
-    if prec > 8:
-        prec = 8
-    factor = 10**prec
-    quantity = math.floor(raw_qty * factor) / factor
+    quantity = _floor_quantity(notional, price, prec)
     if quantity <= 0:
         raise RuntimeError(f"Computed non-positive quantity for {symbol}: {quantity}")
 
@@ -512,8 +1009,8 @@ def place_market_order(
         "symbol": symbol,
         "side": side,
         "type": "MARKET",
-        # Format quantity using the allowed precision so we don't exceed Binance's limits.
-        "quantity": f"{quantity:.{prec}f}",
+        # Quantized to the allowed precision, so exactly prec decimals are sent.
+        "quantity": format(quantity, "f"),
     }
     print(f"Placing MARKET {side} on {symbol}: ~{notional} USDT, qty ≈ {quantity}")
     _, data = _signed_request(api_key, api_secret, "POST", "/fapi/v1/order", params)
@@ -521,27 +1018,96 @@ def place_market_order(
     return data
 
 
+# CSV `direct` values that open/add to a position -> Binance order side.
+_DIRECT_TO_SIDE = {"long": "BUY", "short": "SELL", "buy": "BUY", "sell": "SELL"}
+
+
 def _direct_to_side(direct: str) -> str:
-    d = direct.strip().lower()
-    if d == "long":
-        return "BUY"
-    if d == "short":
-        return "SELL"
-    raise ValueError(f"Unknown direct: {direct!r} (expected 'Long' or 'Short')")
+    try:
+        return _DIRECT_TO_SIDE[direct.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Unknown direct: {direct!r} (expected 'Long', 'Short', 'BUY' or 'SELL')") from None
+
+
+# Quantization exponents for quantity precisions 0..8 (Decimal("1"), Decimal("0.1"), ... Decimal("1E-8")).
+_QTY_STEPS = tuple(Decimal(1).scaleb(-p) for p in range(9))
+
+
+def _floor_quantity(notional: float, price: float, prec: int) -> Decimal:
+    """notional / price rounded down to prec decimals (clamped to 0..8), in decimal arithmetic.
+
+    Float floor(raw * 10**prec) can land one step low (e.g. 0.3 / 0.1 -> 2.999...), which either
+    shrinks the order or trips LOT_SIZE; Decimal over the shortest float reprs does not drift.
+    """
+    step = _QTY_STEPS[max(0, min(8, prec))]
+    return (Decimal(str(notional)) / Decimal(str(price))).quantize(step, rounding=ROUND_DOWN)
 
 
 def _quantity_from_usdt(symbol: str, amount_usdt: float, price: float, quantity_precision: Optional[int] = None) -> str:
     """Compute contract quantity from USDT notional and price; return string for API."""
     prec = quantity_precision if quantity_precision is not None else _fetch_quantity_precision(symbol)
-    prec = max(0, min(8, prec))
     if price <= 0:
         raise ValueError(f"Invalid price for {symbol}: {price}")
-    raw_qty = amount_usdt / price
-    factor = 10**prec
-    quantity = math.floor(raw_qty * factor) / factor
+    quantity = _floor_quantity(amount_usdt, price, prec)
     if quantity <= 0:
         raise ValueError(f"Computed non-positive quantity for {symbol}: {quantity} (amount_usdt={amount_usdt}, price={price})")
-    return f"{quantity:.{prec}f}"
+    return format(quantity, "f")
+
+
+# Compact JSON for one batchOrders entry, with the constant fields baked in. Every value substituted is
+# an exchange symbol, a side enum or a number formatted here, so no escaping is needed.
+_MARKET_ORDER_JSON = '{{"symbol":"{}","side":"{}","type":"MARKET","quantity":"{}"}}'
+_LIMIT_ORDER_JSON = '{{"symbol":"{}","side":"{}","type":"LIMIT","quantity":"{}","timeInForce":"GTC","price":"{}"}}'
+
+
+def _serialize_order(symbol: str, side: str, order_type: str, quantity: str, price: Optional[str] = None) -> str:
+    """One batchOrders entry as compact JSON (LIMIT entries carry timeInForce=GTC and price)."""
+    if order_type == "LIMIT":
+        return _LIMIT_ORDER_JSON.format(symbol, side, quantity, price)
+    return _MARKET_ORDER_JSON.format(symbol, side, quantity)
+
+
+def _serialize_batch(entries: List[str]) -> str:
+    """Join _serialize_order entries into the exact batchOrders string that is signed and sent."""
+    return "[" + ",".join(entries) + "]"
+
+
+class _PreparedBatch(NamedTuple):
+    """Batch orders normalized once into parallel columns (one entry per order)."""
+
+    symbols: List[str]
+    sides: List[str]
+    types: List[str]
+    amounts_usdt: List[float]
+    prices: List[Optional[float]]  # None -> use mark price
+
+
+def _prepare_batch(orders: List[dict]) -> _PreparedBatch:
+    """Validate and normalize place_batch_orders input once (symbol resolved, side/type/amount/price typed)."""
+    prepared = _PreparedBatch([], [], [], [], [])
+    for o in orders:
+        symbol = resolve_symbol(_usdt_symbol(o.get("symbol")))
+        order_type = (o.get("type") or o.get("orderType") or "MARKET").strip().upper()
+        if order_type not in ("MARKET", "LIMIT"):
+            order_type = "MARKET"
+        amount_usdt = float(o.get("amountUsdt") or o.get("amount_usdt") or 0)
+        if amount_usdt <= 0:
+            raise ValueError(f"Order for {symbol}: amountUsdt must be positive, got {amount_usdt}")
+        pos_side = (o.get("positionSide") or o.get("position_side") or "LONG").strip().upper()
+        if pos_side not in ("LONG", "SHORT"):
+            pos_side = "LONG"
+        price_val = o.get("price")
+        if order_type == "MARKET" or price_val is None or price_val == "":
+            price = None
+        else:
+            price = float(price_val)
+
+        prepared.symbols.append(symbol)
+        prepared.sides.append("BUY" if pos_side == "LONG" else "SELL")
+        prepared.types.append(order_type)
+        prepared.amounts_usdt.append(amount_usdt)
+        prepared.prices.append(price)
+    return prepared
 
 
 def place_batch_orders(
@@ -552,7 +1118,10 @@ def place_batch_orders(
 ) -> list:
     """
     Place multiple orders via Binance POST /fapi/v1/batchOrders (max 5 per request).
-    Chunks into batches of 5 and returns combined responses.
+    Chunks into batches of 5, sends the chunks concurrently (up to 4 in flight) and returns
+    the combined responses in input order. If some chunks fail, the others' orders are still audited
+    and returned, with an {"error": message} entry per order of each failed chunk; if every chunk
+    fails, the first error is raised.
 
     Each order dict:
       - symbol: e.g. BTCUSDT
@@ -561,93 +1130,238 @@ def place_batch_orders(
       - positionSide: "LONG" or "SHORT" (maps to side BUY/SELL)
       - price: optional; required for LIMIT; if LIMIT and missing, use mark price
 
-    If leverage is set, set_leverage(symbol, leverage) is called for each unique symbol before placing.
+    If leverage is set, set_leverage(symbol, leverage) is called concurrently for each unique symbol
+    and all calls complete before any order is placed.
     """
     if api_key is None or api_secret is None:
         api_key, api_secret = _get_keys()
     if not orders:
         return []
 
-    if leverage is not None:
-        leverage = max(1, int(leverage))
-        symbols_seen: set = set()
-        for o in orders:
-            sym = (o.get("symbol") or "").strip().upper()
-            if not sym or not sym.endswith("USDT"):
-                sym = (sym or "") + "USDT"
-            if sym:
-                resolved = resolve_symbol(sym)
-                if resolved not in symbols_seen:
-                    symbols_seen.add(resolved)
-                    set_leverage(resolved, leverage, api_key=api_key, api_secret=api_secret)
+    prepared = _prepare_batch(orders)
 
     BATCH_SIZE = 5
+    MAX_WORKERS = 4
+    LEVERAGE_MAX_WORKERS = 8
+    if leverage is not None:
+        leverage = max(1, int(leverage))
+        # Leverage calls for different symbols are independent; run them concurrently and wait for
+        # all of them (re-raising the first failure) before any order goes out.
+        unique_symbols = list(dict.fromkeys(prepared.symbols))
+        with ThreadPoolExecutor(max_workers=min(LEVERAGE_MAX_WORKERS, len(unique_symbols))) as ex:
+            list(
+                ex.map(
+                    lambda s: set_leverage(s, leverage, api_key=api_key, api_secret=api_secret),
+                    unique_symbols,
+                )
+            )
+    # Orders without a price are sized off the mark; with several such symbols one bulk ticker
+    # request replaces a request per symbol (missing symbols still fall back to _get_mark_price).
+    mark_symbols = {symbol for symbol, price in zip(prepared.symbols, prepared.prices) if price is None}
+    marks = _fetch_all_mark_prices() if len(mark_symbols) > 1 else {}
+    # Serialize every order up front (pricing/qty included) so the POSTs can go out concurrently.
+    payloads: List[str] = []
+    for symbol, side, order_type, amount_usdt, price in zip(*prepared):
+        if price is None:
+            price = marks.get(symbol) or _get_mark_price(symbol)
+        qty_str = _quantity_from_usdt(symbol, amount_usdt, price)
+        payloads.append(_serialize_order(symbol, side, order_type, qty_str, f"{round(price, 8)}"))
+    chunk_payloads = [payloads[i : i + BATCH_SIZE] for i in range(0, len(payloads), BATCH_SIZE)]
+
+    def _post_chunk(batch_payloads: List[str]) -> Any:
+        # Binance expects batchOrders as a compact JSON string parameter; the entries are already
+        # serialized, so the signed querystring matches what is actually sent.
+        params = {"batchOrders": _serialize_batch(batch_payloads)}
+        # Each batchOrders call is one request for IP weight but counts every order against the order limits.
+        _, data = _signed_request(
+            api_key, api_secret, "POST", "/fapi/v1/batchOrders", params, order_count=len(batch_payloads)
+        )
+        return data
+
+    # Chunks are independent requests; dispatch them concurrently (paced by _RATE_LIMITER)
+    # and collect each one's response or exception in submission order.
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunk_payloads))) as ex:
+        futures = [ex.submit(_post_chunk, batch_payloads) for batch_payloads in chunk_payloads]
+    errors = [f.exception() for f in futures]
+    if all(errors):
+        raise errors[0]
+
+    # Orders from chunks that went through are live on the exchange, so they are audited and returned
+    # even when another chunk failed; a failed chunk contributes one {"error": ...} entry per order.
     all_responses: list = []
-    for i in range(0, len(orders), BATCH_SIZE):
-        chunk = orders[i : i + BATCH_SIZE]
-        batch_payloads = []
-        for o in chunk:
-            symbol = (o.get("symbol") or "").strip().upper()
-            if not symbol or not symbol.endswith("USDT"):
-                symbol = (symbol or "") + "USDT"
-            symbol = resolve_symbol(symbol)
-            order_type = (o.get("type") or o.get("orderType") or "MARKET").strip().upper()
-            if order_type not in ("MARKET", "LIMIT"):
-                order_type = "MARKET"
-            amount_usdt = float(o.get("amountUsdt") or o.get("amount_usdt") or 0)
-            if amount_usdt <= 0:
-                raise ValueError(f"Order for {symbol}: amountUsdt must be positive, got {amount_usdt}")
-            pos_side = (o.get("positionSide") or o.get("position_side") or "LONG").strip().upper()
-            if pos_side not in ("LONG", "SHORT"):
-                pos_side = "LONG"
-            side = "BUY" if pos_side == "LONG" else "SELL"
-
-            if order_type == "MARKET":
-                price = _get_mark_price(symbol)
-            else:
-                price_val = o.get("price")
-                if price_val is None or price_val == "":
-                    price = _get_mark_price(symbol)
-                else:
-                    price = float(price_val)
-            qty_str = _quantity_from_usdt(symbol, amount_usdt, price)
-
-            payload = {
-                "symbol": symbol,
-                "side": side,
-                "type": order_type,
-                "quantity": qty_str,
-            }
-            if order_type == "LIMIT":
-                payload["timeInForce"] = "GTC"
-                payload["price"] = f"{round(price, 8)}"
-            batch_payloads.append(payload)
-
-        # Binance expects batchOrders as a compact JSON string parameter; encode with separators
-        # so the signed querystring matches what is actually sent.
-        params = {"batchOrders": json.dumps(batch_payloads, separators=(",", ":"))}
-        _, data = _signed_request(api_key, api_secret, "POST", "/fapi/v1/batchOrders", params)
+    for f, err, batch_payloads in zip(futures, errors, chunk_payloads):
+        if err is not None:
+            _get_trade_logger().error("batchOrders chunk of %d failed: %s", len(batch_payloads), err)
+            all_responses.extend({"error": str(err)} for _ in batch_payloads)
+            continue
+        data = f.result()
         chunk = data if isinstance(data, list) else [data]
         for item in chunk:
             if isinstance(item, dict) and item.get("orderId") is not None:
                 append_order_status_audit(item, event_type="placed", source="batch")
-        if isinstance(data, list):
-            all_responses.extend(data)
-        else:
-            all_responses.append(data)
+        all_responses.extend(chunk)
     return all_responses
 
 
+# Upper bound for --parallel on the orders CSV path; keeps bursts well inside Binance's per-IP limits.
+PLACE_ORDERS_MAX_PARALLEL = 10
+
+
+class _RowOutcome(NamedTuple):
+    stdout: List[str]
+    stderr: List[str]
+    result: Optional[dict]  # None for skipped rows (and closes with no open position)
+
+
+# reduce_only cell values that mean "true" (compared after strip().lower()).
+_TRUTHY = frozenset(("true", "1", "yes", "y"))
+
+
+def _place_row(row: dict, api_key: str, api_secret: str, marks: Optional[_MarkSnapshot] = None) -> _RowOutcome:
+    """Validate and execute one orders row; order failures are captured in the outcome, not raised.
+
+    marks supplies shared sizing prices; without it (or on a miss) place_market_order fetches the ticker.
+    """
+    stdout_lines: List[str] = []
+    stderr_lines: List[str] = []
+    currency = (row.get("currency") or "").strip().upper()
+    size_str = (row.get("size_usdt") or row.get("size") or "").strip()
+    direct = (row.get("direct") or "").strip()
+    lever_str = (row.get("lever") or "").strip()
+    reduce_only = (row.get("reduce_only") or "").strip().lower() in _TRUTHY
+
+    if not currency or not size_str or not direct:
+        stdout_lines.append(f"Skipping invalid row: {row}")
+        return _RowOutcome(stdout_lines, stderr_lines, None)
+
+    try:
+        size_usdt = float(size_str)
+    except ValueError:
+        stdout_lines.append(f"Invalid size_usdt in row (skipping): {row}")
+        return _RowOutcome(stdout_lines, stderr_lines, None)
+
+    max_size = ORDER_DEFAULTS["max_size_usdt"]
+    min_size = ORDER_DEFAULTS["min_size_usdt"]
+
+    if not reduce_only:
+        if size_usdt > max_size:
+            stdout_lines.append(
+                f"Clamping {currency} size from {size_usdt} to max_size_usdt {max_size}"
+            )
+            size_usdt = max_size
+        if min_size > 0 and size_usdt < min_size:
+            stdout_lines.append(
+                f"Size {size_usdt} below min_size_usdt {min_size} for {currency}; skipping row."
+            )
+            return _RowOutcome(stdout_lines, stderr_lines, None)
+
+    leverage = None
+    if lever_str:
+        try:
+            leverage = int(lever_str)
+        except ValueError:
+            stdout_lines.append(f"Invalid lever in row (skipping leverage change): {row}")
+    else:
+        leverage = ORDER_DEFAULTS["leverage"]
+
+    quantity_precision = None
+    # Normalize user currency to a Binance futures symbol:
+    # - If the user already provided a symbol ending with USDT (e.g. ALPACAUSDT),
+    #   keep it as-is.
+    # - Otherwise, append USDT (e.g. ALPACA -> ALPACAUSDT).
+    symbol = resolve_symbol(_usdt_symbol(currency))
+
+    result = None
+    try:
+        if reduce_only or direct.lower() == "close":
+            resp = close_position(
+                symbol, fraction=1.0, api_key=api_key, api_secret=api_secret
+            )
+            if resp is not None:
+                stdout_lines.append(f"Order OK (close): {_dumps(resp)}")
+                result = {"currency": currency, "ok": True, "response": resp, "error": None}
+        else:
+            # Long/Short and BUY/SELL all map through _DIRECT_TO_SIDE
+            side = _direct_to_side(direct)
+            resp = place_market_order(
+                symbol,
+                side,
+                size_usdt,
+                leverage=leverage,
+                quantity_precision=quantity_precision,
+                api_key=api_key,
+                api_secret=api_secret,
+                price_hint=marks.get(symbol) if marks is not None else None,
+            )
+            stdout_lines.append(f"Order OK: {_dumps(resp)}")
+            result = {"currency": currency, "ok": True, "response": resp, "error": None}
+    except Exception as e:
+        err_str = str(e)
+        _get_trade_logger().exception("Order FAILED for %s: %s", currency, e)
+        stderr_lines.append(f"Order FAILED for {currency}: {err_str}")
+        result = {"currency": currency, "ok": False, "response": None, "error": err_str}
+    return _RowOutcome(stdout_lines, stderr_lines, result)
+
+
+def _row_symbol_key(row: dict) -> str:
+    """Contract an orders row trades (e.g. BTC and BTCUSDT, HYPE and 1000HYPE share one), used to chain rows.
+
+    Blank or unknown currencies fall back to the raw upper-cased value; _place_row reports those itself.
+    """
+    currency = (row.get("currency") or "").strip().upper()
+    if not currency:
+        return currency
+    try:
+        return resolve_symbol(_usdt_symbol(currency))
+    except ValueError:
+        return currency
+
+
+def _place_rows_parallel(
+    rows: Iterable[dict], api_key: str, api_secret: str, parallel: int, marks: _MarkSnapshot
+) -> Iterator[_RowOutcome]:
+    """Run _place_row over a thread pool sharing _SESSION; outcomes are yielded in row order.
+
+    Rows for the same contract are chained so e.g. an open followed by a close still run in file order.
+    At most 2 * parallel rows are in flight: the oldest outcome is yielded before the next row is
+    submitted, so a large CSV is not queued (or held in memory) all at once, and a consumer that stops
+    early leaves the remaining rows unplaced.
+    """
+    def _after(prev: Optional[Future], row: dict) -> _RowOutcome:
+        if prev is not None:
+            prev.exception()  # wait for it; its own error surfaces when outcomes are collected
+        return _place_row(row, api_key, api_secret, marks)
+
+    window = 2 * parallel
+    in_flight: Deque[Future] = deque()
+    last_by_symbol: Dict[str, Future] = {}
+    with ThreadPoolExecutor(max_workers=parallel) as ex:
+        for row in rows:
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+            key = _row_symbol_key(row)
+            fut = ex.submit(_after, last_by_symbol.get(key), row)
+            last_by_symbol[key] = fut
+            in_flight.append(fut)
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
 def place_orders_from_rows(
-    rows: List[dict],
+    rows: Iterable[dict],
     api_key: Optional[str] = None,
     api_secret: Optional[str] = None,
+    parallel: int = 1,
 ) -> dict:
     """
-    Place a batch of market orders from a list of row dicts (same shape as CSV rows).
+    Place a batch of market orders from row dicts (same shape as CSV rows); rows may be any
+    iterable, e.g. a CSV stream from _iter_csv_rows, and are consumed one at a time.
 
     Row keys: currency, size_usdt (or size), direct, lever, reduce_only (optional).
 
+    parallel > 1 places rows concurrently on up to that many threads (capped at
+    PLACE_ORDERS_MAX_PARALLEL); output and results keep row order either way.
+
     Returns:
         success: True if no order failed.
         results: list of {"currency": str, "ok": bool, "response": dict | None, "error": str | None}
@@ -662,100 +1376,21 @@ def place_orders_from_rows(
     results: List[dict] = []
     any_failed = False
 
-    for row in rows:
-        currency = (row.get("currency") or "").strip().upper()
-        size_str = (row.get("size_usdt") or row.get("size") or "").strip()
-        direct = (row.get("direct") or "").strip()
-        lever_str = (row.get("lever") or "").strip()
-        reduce_only = (row.get("reduce_only") or "").strip().lower() in ("true", "1", "yes", "y")
-
-        if not currency or not size_str or not direct:
-            stdout_lines.append(f"Skipping invalid row: {row}")
-            continue
-
-        try:
-            size_usdt = float(size_str)
-        except ValueError:
-            stdout_lines.append(f"Invalid size_usdt in row (skipping): {row}")
-            continue
-
-        max_size = ORDER_DEFAULTS["max_size_usdt"]
-        min_size = ORDER_DEFAULTS["min_size_usdt"]
-
-        if not reduce_only:
-            if size_usdt > max_size:
-                stdout_lines.append(
-                    f"Clamping {currency} size from {size_usdt} to max_size_usdt {max_size}"
-                )
-                size_usdt = max_size
-            if min_size > 0 and size_usdt < min_size:
-                stdout_lines.append(
-                    f"Size {size_usdt} below min_size_usdt {min_size} for {currency}; skipping row."
-                )
-                continue
-
-        leverage = None
-        if lever_str:
-            try:
-                leverage = int(lever_str)
-            except ValueError:
-                stdout_lines.append(f"Invalid lever in row (skipping leverage change): {row}")
-        else:
-            leverage = ORDER_DEFAULTS["leverage"]
-
-        quantity_precision = None
-        # Normalize user currency to a Binance futures symbol:
-        # - If the user already provided a symbol ending with USDT (e.g. ALPACAUSDT),
-        #   keep it as-is.
-        # - Otherwise, append USDT (e.g. ALPACA -> ALPACAUSDT).
-        cur_upper = currency.strip().upper()
-        if cur_upper.endswith("USDT"):
-            symbol_input = cur_upper
-        else:
-            symbol_input = cur_upper + "USDT"
-        symbol = resolve_symbol(symbol_input)
+    # Once a run spans several symbols, one bulk ticker request sizes the remaining market orders
+    # instead of one request per row; single-symbol runs keep the lighter per-symbol request.
+    marks = _MarkSnapshot()
+    parallel = max(1, min(parallel, PLACE_ORDERS_MAX_PARALLEL))
+    if parallel > 1:
+        outcomes: Iterable[_RowOutcome] = _place_rows_parallel(rows, api_key, api_secret, parallel, marks)
+    else:
+        outcomes = (_place_row(row, api_key, api_secret, marks) for row in rows)
 
-        try:
-            d = direct.strip().lower()
-            if d == "close" or reduce_only:
-                resp = close_position(
-                    symbol, fraction=1.0, api_key=api_key, api_secret=api_secret
-                )
-                if resp is not None:
-                    stdout_lines.append(f"Order OK (close): {json.dumps(resp)}")
-                    results.append({"currency": currency, "ok": True, "response": resp, "error": None})
-            elif d in ("sell", "buy"):
-                side = direct.strip().upper()
-                resp = place_market_order(
-                    symbol,
-                    side,
-                    size_usdt,
-                    leverage=leverage,
-                    quantity_precision=quantity_precision,
-                    api_key=api_key,
-                    api_secret=api_secret,
-                )
-                stdout_lines.append(f"Order OK: {json.dumps(resp)}")
-                results.append({"currency": currency, "ok": True, "response": resp, "error": None})
-            else:
-                side = _direct_to_side(direct)
-                resp = place_market_order(
-                    symbol,
-                    side,
-                    size_usdt,
-                    leverage=leverage,
-                    quantity_precision=quantity_precision,
-                    api_key=api_key,
-                    api_secret=api_secret,
-                )
-                stdout_lines.append(f"Order OK: {json.dumps(resp)}")
-                results.append({"currency": currency, "ok": True, "response": resp, "error": None})
-        except Exception as e:
-            any_failed = True
-            err_str = str(e)
-            _get_trade_logger().exception("Order FAILED for %s: %s", currency, e)
-            stderr_lines.append(f"Order FAILED for {currency}: {err_str}")
-            results.append({"currency": currency, "ok": False, "response": None, "error": err_str})
+    for outcome in outcomes:
+        stdout_lines.extend(outcome.stdout)
+        stderr_lines.extend(outcome.stderr)
+        if outcome.result is not None:
+            results.append(outcome.result)
+            any_failed = any_failed or not outcome.result["ok"]
 
     return {
         "success": not any_failed,
@@ -765,7 +1400,13 @@ def place_orders_from_rows(
     }
 
 
-def place_orders_from_csv(csv_path: Path) -> None:
+def _iter_csv_rows(path: Path) -> Iterator[Dict[str, str]]:
+    """Yield rows of a headed CSV lazily, one dict per line, without materializing the file."""
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def place_orders_from_csv(csv_path: Path, parallel: int = 1) -> None:
     """
     Place a batch of market orders from a CSV file with header:
 
@@ -776,6 +1417,8 @@ def place_orders_from_csv(csv_path: Path) -> None:
     - direct: 'Long', 'Short', 'Close', or 'SELL'/'BUY' (Close or reduce_only=true = close 100% of position)
     - lever: integer leverage (optional/blank -> no change)
     - reduce_only: optional 'true' when direct is SELL/BUY for closing (Binance has no Close side)
+
+    parallel: number of rows placed concurrently (see place_orders_from_rows).
     """
     csv_path = csv_path.resolve()
     if not csv_path.exists():
@@ -783,15 +1426,13 @@ def place_orders_from_csv(csv_path: Path) -> None:
         sys.exit(1)
 
     print(f"Reading orders from {csv_path}...")
-    with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    if not rows:
+    rows = _iter_csv_rows(csv_path)
+    first = next(rows, None)
+    if first is None:
         print("No orders in CSV.")
         return
 
-    out = place_orders_from_rows(rows)
+    out = place_orders_from_rows(itertools.chain((first,), rows), parallel=parallel)
     if out["stdout"]:
         print(out["stdout"])
     if out["stderr"]:
@@ -804,6 +1445,112 @@ def place_orders_from_csv(csv_path: Path) -> None:
 ORDER_CLOSE_TEMPLATE_PATH = (
     Path(__file__).resolve().parent.parent / "data" / "binance" / "orders" / "order_close_template.csv"
 )
+# Max symbols closed concurrently from a close template (each in-flight close is 2 signed requests).
+CLOSE_TEMPLATE_MAX_WORKERS = 10
+# Max close-template rows read ahead of the workers; bounds memory for very large templates.
+CLOSE_TEMPLATE_MAX_PENDING = 1024
+# Templates at least this large are parsed with pandas' C reader (when installed); below it the
+# pandas import costs more than the csv module spends parsing.
+CLOSE_TEMPLATE_PANDAS_MIN_BYTES = 1 << 20
+
+
+# Close-template fields, in the order _iter_close_template_rows yields them.
+_CLOSE_TEMPLATE_FIELDS = ("symbol", "fraction", "order_type", "price")
+
+
+def _close_template_columns(header: List[str]) -> List[Optional[str]]:
+    """Header name to read for each of _CLOSE_TEMPLATE_FIELDS (None if absent); orderType is accepted for order_type."""
+    names = set(header)
+    cols: List[Optional[str]] = [f if f in names else None for f in _CLOSE_TEMPLATE_FIELDS]
+    if cols[2] is None and "orderType" in names:
+        cols[2] = "orderType"
+    return cols
+
+
+def _iter_close_template_rows(path: Path) -> Iterator[Tuple[str, str, str, str]]:
+    """Yield raw (symbol, fraction, order_type, price) strings per close-template row ("" if missing).
+
+    Columns are located once from the header and read by index, so no per-row dict is built. Large
+    files go through pandas.read_csv (C engine) in CLOSE_TEMPLATE_MAX_PENDING-row chunks so rows
+    still stream; otherwise, or without pandas, the stdlib csv reader is used.
+    """
+    if path.stat().st_size >= CLOSE_TEMPLATE_PANDAS_MIN_BYTES:
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        if pd is not None:
+            reader = pd.read_csv(
+                path, dtype=str, keep_default_na=False, engine="c", chunksize=CLOSE_TEMPLATE_MAX_PENDING
+            )
+            with reader:
+                for chunk in reader:
+                    cols = [c or "" for c in _close_template_columns(list(chunk.columns))]
+                    yield from chunk.reindex(columns=cols, fill_value="").fillna("").itertuples(
+                        index=False, name=None
+                    )
+            return
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        pos = {name: i for i, name in enumerate(header)}
+        idx = [pos.get(c) if c else None for c in _close_template_columns(header)]
+        width = len(header)
+        full = operator.itemgetter(*idx) if None not in idx else None
+        for rec in reader:
+            if not rec:
+                continue  # blank line (csv.DictReader skips these too)
+            if full is not None and len(rec) >= width:
+                yield full(rec)
+            else:
+                n = len(rec)
+                yield tuple(rec[i] if i is not None and i < n else "" for i in idx)
+
+
+def _close_template_row(
+    symbol: str,
+    fraction: float,
+    order_type: str,
+    price_str: str,
+    api_key: str,
+    api_secret: str,
+    marks: Optional[_MarkSnapshot] = None,
+    positions: Optional[Dict[str, dict]] = None,
+) -> None:
+    """Execute one close-template row; failures are reported, not raised.
+
+    marks supplies shared prices for LIMIT-at-mark rows; on a miss or a stale snapshot the symbol's
+    mark is fetched individually.
+    positions is an account snapshot still valid for this symbol; None re-fetches the position.
+    """
+    try:
+        if order_type == "MARKET":
+            resp = close_position(
+                symbol, fraction=fraction, api_key=api_key, api_secret=api_secret, positions=positions
+            )
+            if resp is not None:
+                _emit(f"Order OK (close MARKET): {_dumps(resp, indent=_INDENT)}")
+        else:
+            if price_str.upper() == "MARK" or price_str == "":
+                price = (marks.get(symbol) if marks else None) or _get_mark_price(symbol)
+                _emit(f"Using mark price for {symbol}: {price}")
+            else:
+                price = float(price_str)
+            resp = close_position_limit(
+                symbol,
+                fraction=fraction,
+                price=price,
+                api_key=api_key,
+                api_secret=api_secret,
+                positions=positions,
+            )
+            if resp is not None:
+                _emit(f"Order OK (close LIMIT): {_dumps(resp, indent=_INDENT)}")
+    except Exception as e:
+        _get_stderr_logger().error("Close FAILED for %s: %s", symbol, e)
 
 
 def place_close_orders_from_template(csv_path: Optional[Path] = None) -> None:
@@ -814,6 +1561,10 @@ def place_close_orders_from_template(csv_path: Optional[Path] = None) -> None:
     - fraction: 1.0 = 100%, 0.5 = 50%
     - order_type: MARKET or LIMIT
     - price: for MARKET leave empty; for LIMIT use a number or "mark" to use current mark price
+
+    Rows are streamed from the file into a thread pool: different symbols are closed concurrently
+    (up to CLOSE_TEMPLATE_MAX_WORKERS, paced by the rate limiter) while rows for the same symbol run
+    in file order so partial fractions compound as before.
     """
     path = (csv_path or ORDER_CLOSE_TEMPLATE_PATH).resolve()
     if not path.exists():
@@ -822,90 +1573,127 @@ def place_close_orders_from_template(csv_path: Optional[Path] = None) -> None:
 
     api_key, api_secret = _get_keys()
     print(f"Reading close template from {path}...")
-    with open(path, newline="") as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
 
-    if not rows:
+    pending = threading.BoundedSemaphore(CLOSE_TEMPLATE_MAX_PENDING)
+
+    def _close_after(
+        prev: Optional[Future],
+        args: Tuple[str, float, str, str],
+        marks: _MarkSnapshot,
+        positions: Optional[Dict[str, dict]],
+    ) -> None:
+        try:
+            # Same-symbol rows are chained; prev was submitted first, so it is running or done.
+            if prev is not None:
+                prev.result()
+            _close_template_row(*args, api_key, api_secret, marks, positions)
+        finally:
+            pending.release()
+
+    n_rows = 0
+    last_by_symbol: Dict[str, Future] = {}
+    # LIMIT-at-mark rows share one bulk ticker snapshot (fetched lazily, once a second symbol needs a
+    # price); past MARK_SNAPSHOT_MAX_AGE_SECONDS rows fall back to a fresh per-symbol mark.
+    marks = _MarkSnapshot()
+    # One account-wide positionRisk snapshot serves the first row of every symbol; later rows for a
+    # symbol re-fetch, since the earlier close changed that position.
+    positions: Optional[Dict[str, dict]] = None
+    positions_fetched = False
+    with ThreadPoolExecutor(max_workers=CLOSE_TEMPLATE_MAX_WORKERS) as ex:
+        for symbol, fraction_str, order_type, price_str in _iter_close_template_rows(path):
+            n_rows += 1
+            symbol = symbol.strip()
+            if not symbol:
+                continue
+            symbol = resolve_symbol(_usdt_symbol(symbol))
+            try:
+                fraction = float(fraction_str or "1.0")
+            except ValueError:
+                fraction = 1.0
+            fraction = max(0.0, min(1.0, fraction))
+            order_type = (order_type.strip() or "MARKET").upper()
+            if order_type not in ("MARKET", "LIMIT"):
+                order_type = "MARKET"
+            price_str = price_str.strip()
+            if not positions_fetched:
+                positions_fetched = True
+                try:
+                    positions = _fetch_positions(api_key, api_secret)
+                except Exception as e:
+                    _get_trade_logger().warning("positionRisk snapshot failed, fetching per row: %s", e)
+            prev = last_by_symbol.get(symbol)
+            pending.acquire()
+            last_by_symbol[symbol] = ex.submit(
+                _close_after,
+                prev,
+                (symbol, fraction, order_type, price_str),
+                marks,
+                positions if prev is None else None,
+            )
+
+    if n_rows == 0:
         print("No rows in close template.")
-        return
 
-    for row in rows:
-        symbol = (row.get("symbol") or "").strip().upper()
-        if not symbol:
-            continue
-        if not symbol.endswith("USDT"):
-            symbol = symbol + "USDT"
-        symbol = resolve_symbol(symbol)
+
+_USAGE = (
+    "Usage:\n"
+    "  python scripts/binance_trade_api.py orders.csv [--parallel N]\n"
+    "  python scripts/binance_trade_api.py --close-template [path]\n"
+    "  python scripts/binance_trade_api.py --order-status SYMBOL ORDER_ID\n\n"
+    "Orders CSV format: currency,size_usdt,direct,lever\n"
+    "Close template format: symbol,fraction,order_type,price (order_type=MARKET|LIMIT, price=number|mark)\n"
+    "Order status: query by symbol and orderId; result is appended to order_status_audit.csv.\n"
+)
+
+
+def _cmd_close_template(argv: list[str]) -> None:
+    place_close_orders_from_template(Path(argv[2]) if len(argv) > 2 else None)
+
+
+def _cmd_order_status(argv: list[str]) -> None:
+    try:
+        order_id = int(argv[3])
+    except ValueError:
+        print("ORDER_ID must be an integer.", file=sys.stderr)
+        sys.exit(1)
+    symbol = resolve_symbol(_usdt_symbol(argv[2]))
+    # Always append to order_status_audit.csv (same as data/binance/orders/order_status_audit.csv)
+    data = get_order(symbol, order_id=order_id, write_audit=True)
+    _emit(_dumps(data, indent=_INDENT))
+
+
+def _cmd_orders_csv(argv: list[str]) -> None:
+    parallel = 1
+    if len(argv) > 2:
         try:
-            fraction = float(row.get("fraction") or "1.0")
+            parallel = int(argv[3]) if argv[2] == "--parallel" and len(argv) == 4 else 0
         except ValueError:
-            fraction = 1.0
-        fraction = max(0.0, min(1.0, fraction))
-        order_type = (row.get("order_type") or row.get("orderType") or "MARKET").strip().upper()
-        if order_type not in ("MARKET", "LIMIT"):
-            order_type = "MARKET"
-        price_str = (row.get("price") or "").strip()
+            parallel = 0
+        if parallel < 1:
+            print(_USAGE, file=sys.stderr)
+            sys.exit(1)
+    place_orders_from_csv(Path(argv[1]), parallel=parallel)
 
-        try:
-            if order_type == "MARKET":
-                resp = close_position(symbol, fraction=fraction, api_key=api_key, api_secret=api_secret)
-                if resp is not None:
-                    print(f"Order OK (close MARKET): {json.dumps(resp, indent=2)}")
-            else:
-                if price_str.upper() == "MARK" or price_str == "":
-                    price = _get_mark_price(symbol)
-                    print(f"Using mark price for {symbol}: {price}")
-                else:
-                    price = float(price_str)
-                resp = close_position_limit(
-                    symbol,
-                    fraction=fraction,
-                    price=price,
-                    api_key=api_key,
-                    api_secret=api_secret,
-                )
-                if resp is not None:
-                    print(f"Order OK (close LIMIT): {json.dumps(resp, indent=2)}")
-        except Exception as e:
-            print(f"Close FAILED for {symbol}: {e}", file=sys.stderr)
+
+# Subcommand flag -> (handler, minimum argv length); any other first argument is an orders CSV path.
+_COMMANDS = {
+    "--close-template": (_cmd_close_template, 2),
+    "--order-status": (_cmd_order_status, 4),
+}
 
 
 def main(argv: list[str]) -> None:
     if len(argv) < 2:
-        print(
-            "Usage:\n"
-            "  python scripts/binance_trade_api.py orders.csv\n"
-            "  python scripts/binance_trade_api.py --close-template [path]\n"
-            "  python scripts/binance_trade_api.py --order-status SYMBOL ORDER_ID\n\n"
-            "Orders CSV format: currency,size_usdt,direct,lever\n"
-            "Close template format: symbol,fraction,order_type,price (order_type=MARKET|LIMIT, price=number|mark)\n"
-            "Order status: query by symbol and orderId; result is appended to order_status_audit.csv.\n",
-            file=sys.stderr,
-        )
+        print(_USAGE, file=sys.stderr)
         sys.exit(1)
-    if argv[1] == "--close-template":
-        path = Path(argv[2]) if len(argv) > 2 else None
-        print(f"Using Binance futures base: {BINANCE_FUTURES_BASE}")
-        place_close_orders_from_template(path)
-    elif argv[1] == "--order-status" and len(argv) >= 4:
-        symbol = (argv[2] or "").strip().upper()
-        if not symbol.endswith("USDT"):
-            symbol = symbol + "USDT"
-        symbol = resolve_symbol(symbol)
-        try:
-            order_id = int(argv[3])
-        except ValueError:
-            print("ORDER_ID must be an integer.", file=sys.stderr)
-            sys.exit(1)
-        # Always append to order_status_audit.csv (same as data/binance/orders/order_status_audit.csv)
-        print(f"Using Binance futures base: {BINANCE_FUTURES_BASE}")
-        data = get_order(symbol, order_id=order_id, write_audit=True)
-        print(json.dumps(data, indent=2))
-    else:
-        csv_file = Path(argv[1])
-        print(f"Using Binance futures base: {BINANCE_FUTURES_BASE}")
-        place_orders_from_csv(csv_file)
+    handler, min_args = _COMMANDS.get(argv[1], (_cmd_orders_csv, 2))
+    if len(argv) < min_args:
+        print(_USAGE, file=sys.stderr)
+        sys.exit(1)
+    print(f"Using Binance futures base: {BINANCE_FUTURES_BASE}")
+    # One exchangeInfo round-trip up front; every resolve_symbol() after this is a local dict probe.
+    _load_exchange_symbols()
+    handler(argv)
 
 
 if __name__ == "__main__":
@@ -552,7 +552,7 @@ def main(use_testnet: bool = False) -> None:
     DATA_BINANCE.mkdir(parents=True, exist_ok=True)
 
     positions_path = DATA_BINANCE / "positions.csv"
-    with open(positions_path, "w", newline="") as f:
+    with open(positions_path, "w", newline="", encoding="utf-8") as f:
         w = csv.DictWriter(f, fieldnames=POSITION_FIELDS, extrasaction="ignore")
         w.writeheader()
         w.writerows(rows)
@@ -581,12 +581,12 @@ def main(use_testnet: bool = False) -> None:
 
     # If file exists but doesn't yet have a timestamp column, rewrite header and backfill blank timestamps.
     if summary_exists:
-        with open(summary_path, newline="") as f:
+        with open(summary_path, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             existing_rows = list(reader)
             existing_fieldnames = reader.fieldnames or []
         if "timestamp" not in existing_fieldnames:
-            with open(summary_path, "w", newline="") as f:
+            with open(summary_path, "w", newline="", encoding="utf-8") as f:
                 w = csv.DictWriter(f, fieldnames=summary_fields)
                 w.writeheader()
                 for row in existing_rows:
@@ -597,7 +597,7 @@ def main(use_testnet: bool = False) -> None:
                     w.writerow(out)
             print(f"Rewrote existing summary file {summary_path} with timestamp column")
 
-    with open(summary_path, "a", newline="") as f:
+    with open(summary_path, "a", newline="", encoding="utf-8") as f:
         w = csv.DictWriter(f, fieldnames=summary_fields)
         if not summary_exists:
             w.writeheader()
@@ -606,7 +606,7 @@ def main(use_testnet: bool = False) -> None:
 
     # Raw account JSON
     account_path = DATA_BINANCE / "account.json"
-    with open(account_path, "w") as f:
+    with open(account_path, "w", encoding="utf-8") as f:
         json.dump(account, f, indent=2)
     print(f"Saved raw account to {account_path}")
 
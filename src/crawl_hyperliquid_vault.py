@@ -10,8 +10,16 @@ import json
 import sys
 from math import trunc
 from pathlib import Path
+from typing import Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json handles the same payloads
+    orjson = None
 
 
 from env_manager import HYPERLIQUID_VAULT_ADDRESS, HYPERLIQUID_INFO_HOST
@@ -23,16 +31,33 @@ API_URLS = [
 ]
 
 
+def _make_session() -> requests.Session:
+    """requests.Session with a pooled HTTPS adapter; info POSTs are read-only, so transient 429/5xx retry."""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"GET", "POST"}),
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+# Shared across fetch_vault_state calls so repeated crawls reuse the TLS connection to the info host.
+_SESSION = _make_session()
+
+
 def fetch_vault_state(address: str) -> dict:
     """Fetch clearinghouse state for a vault address from Hyperliquid API."""
     payload = {"type": "clearinghouseState", "user": address}
     last_error = None
     for url in API_URLS:
         try:
-            r = requests.post(url, json=payload, timeout=15)
+            r = _SESSION.post(url, json=payload, timeout=15)
             r.raise_for_status()
-            return r.json()
-        except requests.RequestException as e:
+            return orjson.loads(r.content) if orjson is not None else r.json()
+        except (requests.RequestException, ValueError) as e:  # ValueError: malformed JSON body
             last_error = e
             continue
     raise RuntimeError(f"All API URLs failed. Last error: {last_error}") from last_error
@@ -62,6 +87,30 @@ def flatten_position(asset_pos: dict) -> dict:
     }
 
 
+# hyperliquid_vault_summary.csv header; \r\n matches the rows csv.DictWriter appended previously.
+SUMMARY_HEADER = "accountValue,totalNtlPos,totalRawUsd,totalMarginUsed,withdrawable\r\n"
+
+# CSV columns: flatten_position's keys, then the derived marginUsedPercentage.
+POSITION_FIELDS = [
+    "coin", "szi", "leverage_type", "leverage_value", "entryPx",
+    "positionValue", "unrealizedPnl", "returnOnEquity", "liquidationPx",
+    "marginUsed", "maxLeverage", "cumFunding_allTime",
+    "cumFunding_sinceOpen", "cumFunding_sinceChange", "time", "marginUsedPercentage",
+]
+
+
+def _iter_position_rows(positions: list, total_margin_used: float) -> Iterator[dict]:
+    """Yield one flattened CSV row per assetPosition, adding marginUsedPercentage of total margin."""
+    for p in positions:
+        row = flatten_position(p)
+        try:
+            pct = (float(row["marginUsed"]) / total_margin_used * 100) if total_margin_used else ""
+        except (TypeError, ValueError):
+            pct = ""
+        row["marginUsedPercentage"] = f"{trunc(pct * 100) / 100:.2f}" if pct != "" else ""
+        yield row
+
+
 def main() -> None:
     out_dir = Path(__file__).resolve().parent.parent
     csv_path = out_dir / "data" / "hyperliquid_vault_positions.csv"
@@ -72,14 +121,18 @@ def main() -> None:
     # Optional: save raw JSON for debugging
     raw_path = out_dir / "data" / "hyperliquid_vault_state.json"
     raw_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(raw_path, "w") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        raw_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(raw_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
     print(f"Raw state saved to {raw_path}")
 
     positions = data.get("assetPositions") or []
     margin = data.get("marginSummary") or {}
     cross = data.get("crossMarginSummary") or {}
-    total_margin_used = (cross or margin).get("totalMarginUsed") or "0"
+    summary = cross or margin  # account-level figures: cross margin when present, else marginSummary
+    total_margin_used = summary.get("totalMarginUsed") or "0"
     try:
         total_margin_used_f = float(total_margin_used)
     except (TypeError, ValueError):
@@ -87,63 +140,36 @@ def main() -> None:
 
     if not positions:
         print("No asset positions in response. Writing empty CSV with margin summary.")
-        rows = []
-    else:
-        rows = [flatten_position(p) for p in positions]
-        for row in rows:
-            mu = row.get("marginUsed", "")
-            try:
-                pct = (float(mu) / total_margin_used_f * 100) if total_margin_used_f else ""
-            except (TypeError, ValueError):
-                pct = ""
-            if pct != "":
-                row["marginUsedPercentage"] = f"{trunc(pct * 100) / 100:.2f}"
-            else:
-                row["marginUsedPercentage"] = ""
-
-    # CSV: positions
+
+    # CSV: positions, streamed straight from the response
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-    if rows:
-        fieldnames = list(rows[0].keys())
-    else:
-        fieldnames = [
-            "coin", "szi", "leverage_type", "leverage_value", "entryPx",
-            "positionValue", "unrealizedPnl", "returnOnEquity", "liquidationPx",
-            "marginUsed", "marginUsedPercentage", "maxLeverage", "cumFunding_allTime",
-            "cumFunding_sinceOpen", "cumFunding_sinceChange", "time",
-        ]
-
-    with open(csv_path, "w", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=POSITION_FIELDS)
         w.writeheader()
-        w.writerows(rows)
+        w.writerows(_iter_position_rows(positions, total_margin_used_f))
 
-    print(f"Wrote {len(rows)} positions to {csv_path}")
+    print(f"Wrote {len(positions)} positions to {csv_path}")
 
     # Print margin summary
     if margin or cross:
-        print("\nMargin summary:")
-        for k, v in (margin or {}).items():
-            print(f"  marginSummary.{k}: {v}")
-        for k, v in (cross or {}).items():
-            print(f"  crossMarginSummary.{k}: {v}")
+        lines = ["\nMargin summary:"]
+        lines.extend(f"  marginSummary.{k}: {v}" for k, v in margin.items())
+        lines.extend(f"  crossMarginSummary.{k}: {v}" for k, v in cross.items())
+        print("\n".join(lines))
 
     # Also write a one-line summary CSV (account-level) for easy time series
     summary_path = out_dir / "data" / "hyperliquid_vault_summary.csv"
-    summary_exists = summary_path.exists()
-    summary_fields = ["accountValue", "totalNtlPos", "totalRawUsd", "totalMarginUsed", "withdrawable"]
-    summary_row = {
-        "accountValue": (cross or margin).get("accountValue", ""),
-        "totalNtlPos": (cross or margin).get("totalNtlPos", ""),
-        "totalRawUsd": (cross or margin).get("totalRawUsd", ""),
-        "totalMarginUsed": (cross or margin).get("totalMarginUsed", ""),
-        "withdrawable": cross.get("withdrawable", ""),
-    }
-    with open(summary_path, "a", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=summary_fields)
-        if not summary_exists:
-            w.writeheader()
-        w.writerow(summary_row)
+    values = (
+        summary.get("accountValue", ""),
+        summary.get("totalNtlPos", ""),
+        summary.get("totalRawUsd", ""),
+        summary.get("totalMarginUsed", ""),
+        cross.get("withdrawable", ""),
+    )
+    # Plain numeric strings need no CSV quoting; drop stray commas so a value can never split a column.
+    line = ",".join("" if v is None else str(v).replace(",", "") for v in values) + "\r\n"
+    with open(summary_path, "a", newline="", encoding="utf-8") as f:
+        f.write(line if f.tell() else SUMMARY_HEADER + line)
     print(f"Appended summary row to {summary_path}")
 
 
@@ -11,15 +11,20 @@ _ROOT = Path(__file__).resolve().parent.parent
 
 
 def _load_env() -> None:
+    env = _ROOT / ".env"
+    local_env = _ROOT / ".env.local"
+    has_env, has_local = env.is_file(), local_env.is_file()
+    if not (has_env or has_local):
+        return  # platform-provided env only (e.g. Railway): skip importing dotenv at all
     try:
         from dotenv import load_dotenv
-        # override=False: shell / process env wins (e.g. RUN_FETCH_LOOPS=false)
-        load_dotenv(_ROOT / ".env", override=False)
-        local_env = _ROOT / ".env.local"
-        if local_env.is_file():
-            load_dotenv(local_env, override=False)
     except ImportError:
-        pass
+        return
+    # override=False: shell / process env wins (e.g. RUN_FETCH_LOOPS=false)
+    if has_env:
+        load_dotenv(env, override=False)
+    if has_local:
+        load_dotenv(local_env, override=False)
 
 
 _load_env()
@@ -30,6 +35,22 @@ _ENV_LOCAL_PATH = _ROOT / ".env.local"
 # Must import after _load_env so .env is applied
 import os
 
+# Lower-cased env flag spellings, shared by the boolean settings below.
+_TRUE_VALUES = frozenset(("true", "1", "yes", "on"))
+_FALSE_VALUES = frozenset(("false", "0", "no", "off"))
+
+
+def _env_int(name: str, default: int) -> int:
+    """Integer setting from the environment; unset or blank uses default, anything else must parse."""
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {raw!r}") from None
+
+
 # --- Paths (derived from project root) ---
 ROOT = _ROOT
 DATA_BINANCE = ROOT / "data" / "binance"
@@ -43,7 +64,9 @@ BINANCE_API_KEY = os.getenv("BINANCE_API_KEY") or os.getenv("BINANCE_UM_API_KEY"
 BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET") or os.getenv("BINANCE_UM_API_SECRET") or ""
 
 # --- Binance optional config ---
-BINANCE_FUNDING_LOOKBACK_DAYS = int(os.getenv("BINANCE_FUNDING_LOOKBACK_DAYS", "90"))
+BINANCE_FUNDING_LOOKBACK_DAYS = _env_int("BINANCE_FUNDING_LOOKBACK_DAYS", 90)
+# If true/1/yes/on, binance_trade_api traces every signed request to stdout and its trade log (DEBUG level).
+BINANCE_DEBUG_REQUESTS = os.getenv("BINANCE_DEBUG_REQUESTS", "").strip().lower() in _TRUE_VALUES
 # User Data Stream WebSocket base (default: mainnet vs testnet from BINANCE_FUTURES_BASE)
 _default_ws = "wss://stream.binancefuture.com" if "demo-fapi" in BINANCE_FUTURES_BASE else "wss://fstream.binance.com"
 BINANCE_WS_BASE = os.getenv("BINANCE_WS_BASE", _default_ws)
@@ -54,15 +77,15 @@ _port_env = os.getenv("PORT") or os.getenv("BACKEND_PORT") or "8000"
 BACKEND_PORT = int(_port_env)
 # If false/0/no/off, backend does not start any fetch loops (positions, market data, order history, funding, WS). Default true.
 _run_fetch_loops = os.getenv("RUN_FETCH_LOOPS", "true").strip().lower()
-RUN_FETCH_LOOPS = _run_fetch_loops not in ("false", "0", "no", "off")
-CRAWL_POSITIONS_INTERVAL_SECONDS = int(os.getenv("CRAWL_POSITIONS_INTERVAL_SECONDS", "60"))
-ORDER_HISTORY_REFRESH_SECONDS = int(os.getenv("ORDER_HISTORY_REFRESH_SECONDS", "60"))
-FUNDING_ESTIMATE_INTERVAL_SECONDS = int(os.getenv("FUNDING_ESTIMATE_INTERVAL_SECONDS", "3600"))
-MARKET_DATA_INTERVAL_SECONDS = int(os.getenv("MARKET_DATA_INTERVAL_SECONDS", "300"))
-FUNDING_RATE_HISTORY_INTERVAL_SECONDS = int(os.getenv("FUNDING_RATE_HISTORY_INTERVAL_SECONDS", "3600"))
-FUNDING_MARKET_DATA_INTERVAL_SECONDS = int(os.getenv("FUNDING_MARKET_DATA_INTERVAL_SECONDS", "3600"))
-FUNDING_FEE_HISTORY_INTERVAL_SECONDS = int(os.getenv("FUNDING_FEE_HISTORY_INTERVAL_SECONDS", "3600"))
-FUNDING_FEE_HISTORY_FIRST_DAYS = int(os.getenv("FUNDING_FEE_HISTORY_FIRST_DAYS", "90"))
+RUN_FETCH_LOOPS = _run_fetch_loops not in _FALSE_VALUES
+CRAWL_POSITIONS_INTERVAL_SECONDS = _env_int("CRAWL_POSITIONS_INTERVAL_SECONDS", 60)
+ORDER_HISTORY_REFRESH_SECONDS = _env_int("ORDER_HISTORY_REFRESH_SECONDS", 60)
+FUNDING_ESTIMATE_INTERVAL_SECONDS = _env_int("FUNDING_ESTIMATE_INTERVAL_SECONDS", 3600)
+MARKET_DATA_INTERVAL_SECONDS = _env_int("MARKET_DATA_INTERVAL_SECONDS", 300)
+FUNDING_RATE_HISTORY_INTERVAL_SECONDS = _env_int("FUNDING_RATE_HISTORY_INTERVAL_SECONDS", 3600)
+FUNDING_MARKET_DATA_INTERVAL_SECONDS = _env_int("FUNDING_MARKET_DATA_INTERVAL_SECONDS", 3600)
+FUNDING_FEE_HISTORY_INTERVAL_SECONDS = _env_int("FUNDING_FEE_HISTORY_INTERVAL_SECONDS", 3600)
+FUNDING_FEE_HISTORY_FIRST_DAYS = _env_int("FUNDING_FEE_HISTORY_FIRST_DAYS", 90)
 
 # --- External APIs ---
 COINGLASS_BASE = os.getenv("COINGLASS_BASE", "https://open-api-v4.coinglass.com")
@@ -79,7 +102,7 @@ _ENV_MANAGER_VARS = [
     "ROOT", "DATA_BINANCE", "ORDER_STATUS_AUDIT_PATH",
     "BINANCE_FUTURES_BASE", "BINANCE_FUTURES_PUBLIC_BASE", "BINANCE_SPOT_BASE",
     "BINANCE_API_KEY", "BINANCE_API_SECRET",
-    "BINANCE_FUNDING_LOOKBACK_DAYS", "BINANCE_WS_BASE",
+    "BINANCE_FUNDING_LOOKBACK_DAYS", "BINANCE_DEBUG_REQUESTS", "BINANCE_WS_BASE",
     "BACKEND_PORT", "RUN_FETCH_LOOPS",
     "CRAWL_POSITIONS_INTERVAL_SECONDS", "ORDER_HISTORY_REFRESH_SECONDS",
     "FUNDING_ESTIMATE_INTERVAL_SECONDS", "MARKET_DATA_INTERVAL_SECONDS",
@@ -89,6 +112,8 @@ _ENV_MANAGER_VARS = [
     "HYPERLIQUID_VAULT_ADDRESS", "HYPERLIQUID_INFO_HOST",
 ]
 _MASK_KEYS = frozenset(("BINANCE_API_KEY", "BINANCE_API_SECRET", "COINGLASS_API_KEY", "ANTHROPIC_API_KEY"))
+# Values are fixed once this module has loaded, so snapshot them here rather than looking each up per call.
+_EXPORTS_SNAPSHOT = {name: globals().get(name) for name in _ENV_MANAGER_VARS}
 
 
 def _mask(s: str, max_visible: int = 4) -> str:
@@ -99,12 +124,7 @@ def _mask(s: str, max_visible: int = 4) -> str:
 
 def print_env_for_debug() -> None:
     """Print all env_manager variables for debugging; API keys/secrets are masked."""
-    import sys
-    mod = sys.modules.get("env_manager") or sys.modules.get("__main__")
-    if mod is None:
-        return
-    for name in _ENV_MANAGER_VARS:
-        val = getattr(mod, name, None)
+    for name, val in _EXPORTS_SNAPSHOT.items():
         if name in _MASK_KEYS and isinstance(val, str) and val:
             val = _mask(val)
         print(f"  {name}={val!r}")
@@ -138,7 +138,7 @@ def write_funding_rate_csv(rows: list[dict], path: Path) -> None:
         except (TypeError, ValueError):
             return 0
     ordered = sorted(rows, key=_key, reverse=True)
-    with open(path, "w", newline="") as f:
+    with open(path, "w", newline="", encoding="utf-8") as f:
         w = csv.DictWriter(f, fieldnames=["symbol", "fundingRate", "fundingTime", "markPrice"])
         w.writeheader()
         for r in ordered:
@@ -154,7 +154,7 @@ def write_funding_rate_csv(rows: list[dict], path: Path) -> None:
 def write_funding_fee_income_csv(rows: list[dict], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     fieldnames = ["time", "time_iso", "symbol", "income", "asset", "tradeId", "info"]
-    with open(path, "w", newline="") as f:
+    with open(path, "w", newline="", encoding="utf-8") as f:
         w = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
         w.writeheader()
         for r in rows:
@@ -183,7 +183,7 @@ def _read_existing_funding_rate_csv(path: Path) -> list[dict]:
         return []
     rows: list[dict] = []
     try:
-        with open(path, newline="") as f:
+        with open(path, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for r in reader:
                 rows.append(dict(r))
@@ -357,7 +357,7 @@ def main() -> int:
                     print(f"positions.csv not found at {positions_path}", file=sys.stderr)
                     return 1
                 try:
-                    with open(positions_path, newline="") as f:
+                    with open(positions_path, newline="", encoding="utf-8") as f:
                         reader = csv.DictReader(f)
                         for row in reader:
                             coin = (row.get("coin") or "").strip()
@@ -378,7 +378,7 @@ def main() -> int:
                     print(f"market_data.csv not found at {market_data_path}", file=sys.stderr)
                     return 1
                 try:
-                    with open(market_data_path, newline="") as f:
+                    with open(market_data_path, newline="", encoding="utf-8") as f:
                         reader = csv.DictReader(f)
                         for row in reader:
                             cur = (row.get("currency") or "").strip()
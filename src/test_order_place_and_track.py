@@ -20,14 +20,52 @@ if str(_scripts) not in sys.path:
 import binance_trade_api as bta
 
 
+# order_ids already confirmed present in the audit CSV (the file is append-only, so a hit stays a hit).
+_audit_order_ids: set = set()
+_AUDIT_SCAN_CHUNK = 1 << 20
+
+
+def _audit_block_has(block: bytes, needle: bytes, order_id: str, col: int) -> bool:
+    """Whether a run of complete CSV lines holds order_id in column col; needle is only a prefilter."""
+    start = 0
+    while True:
+        hit = block.find(needle, start)
+        if hit == -1:
+            return False
+        line = block[block.rfind(b"\n", 0, hit) + 1 : block.find(b"\n", hit)]
+        row = next(csv.reader([line.decode("utf-8")]), [])
+        if len(row) > col and row[col] == order_id:
+            return True
+        start = hit + 1
+
+
 def audit_contains_order_id(order_id: int) -> bool:
+    key = str(order_id)
+    if key in _audit_order_ids:
+        return True
+    bta.flush_order_status_audit()
     path = bta.ORDER_STATUS_AUDIT_PATH
     if not path.exists():
         return False
-    with open(path, newline="", encoding="utf-8") as f:
-        for row in csv.DictReader(f):
-            if str(row.get("order_id", "")) == str(order_id):
+    # order_id is a middle column, so ",<id>," finds candidate rows with a raw bytes search; only those
+    # lines are CSV-parsed to confirm the match is in the order_id column.
+    needle = f",{key},".encode()
+    with open(path, "rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8")]), [])
+        if "order_id" not in header:
+            return False
+        col = header.index("order_id")
+        tail = b""
+        for chunk in iter(lambda: f.read(_AUDIT_SCAN_CHUNK), b""):
+            buf = tail + chunk
+            cut = buf.rfind(b"\n") + 1
+            tail = buf[cut:]
+            if _audit_block_has(buf[:cut], needle, key, col):
+                _audit_order_ids.add(key)
                 return True
+    if tail and _audit_block_has(tail + b"\n", needle, key, col):
+        _audit_order_ids.add(key)
+        return True
     return False
 
 
@@ -67,14 +105,19 @@ def main() -> int:
     print(f"   OK status={status}")
 
     print("4) Optional: wait for FILLED (market order)...")
-    for i in range(8):
-        if status == "FILLED":
-            print("   OK FILLED")
-            break
-        time.sleep(1)
+    # Market orders usually fill within ~100ms: poll from 50ms, doubling up to 1s, for at most 8s.
+    delay = 0.05
+    deadline = time.monotonic() + 8.0
+    polls = 0
+    while status != "FILLED" and time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
         status_data = bta.get_order(symbol, order_id=order_id)
         status = status_data.get("status", "").upper()
-        print(f"   poll {i+1} status={status}")
+        polls += 1
+        print(f"   poll {polls} status={status}")
+    if status == "FILLED":
+        print("   OK FILLED")
     else:
         print(f"   (still {status} after 8s)")
 